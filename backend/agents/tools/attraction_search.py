@@ -1,6 +1,7 @@
 from langchain.tools import BaseTool
 from typing import Optional, Type, Dict, Any, List
 from pydantic import BaseModel, Field
+import asyncio
 import random
 
 class AttractionSearchInput(BaseModel):
@@ -161,5 +162,5 @@ PLANNING TIPS:
         duration_preference: str = "half-day",
         **kwargs: Any,
     ) -> str:
-        """Async version of the attraction search"""
-        return self._run(location, interests, budget_per_activity, duration_preference, **kwargs)
+        """Async version of the attraction search, run in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(self._run, location, interests, budget_per_activity, duration_preference, **kwargs)
@@ -1,10 +1,14 @@
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
+import asyncio
 import os
 from datetime import datetime, timedelta
 import json
 import traceback
-from serpapi import GoogleSearch
+import orjson
+import requests
+from utils.rate_limiter import serpapi_limiter
+from utils.http_client import http_session, SERPAPI_SEARCH_URL
 
 class FlightSearchInput(BaseModel):
     """Input for flight search tool"""
@@ -66,6 +70,30 @@ class FlightSearchTool:
         location_lower = location.lower().strip()
         return airport_codes.get(location_lower, location.upper()[:3])
     
+    def _serpapi_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a SerpAPI search over the shared pooled session, within the shared rate limit"""
+        serpapi_limiter.acquire()
+        response = http_session.get(SERPAPI_SEARCH_URL, params=params, timeout=(3, 15))
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            # SerpAPI reports bad parameters as a JSON error body, which the caller handles;
+            # anything else (e.g. a gateway HTML page) surfaces as the HTTP error itself
+            results = self._serpapi_error_body(response)
+            if results is None:
+                raise
+            return results
+        return orjson.loads(response.content)
+
+    @staticmethod
+    def _serpapi_error_body(response: requests.Response) -> Optional[Dict[str, Any]]:
+        """The JSON error object from a failed SerpAPI response, or None if the body isn't one"""
+        try:
+            results = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return None
+        return results if isinstance(results, dict) and "error" in results else None
+    
     def _search_serpapi_flights(self, origin: str, destination: str, departure_date: str, 
                                passengers: int, return_date: Optional[str] = None) -> List[Dict]:
         """Search flights using SerpAPI Google Flights"""
@@ -102,8 +130,7 @@ class FlightSearchTool:
             
             # Make the search request
             print(f"🔍 SerpAPI params: {params}")
-            search = GoogleSearch(params)
-            results = search.get_dict()
+            results = self._serpapi_get(params)
             
             if "error" in results:
                 print(f"❌ SerpAPI error: {results['error']}")
@@ -121,8 +148,7 @@ class FlightSearchTool:
                             auto_return_date = (departure_dt + timedelta(days=7)).strftime("%Y-%m-%d")
                             params["return_date"] = auto_return_date
                             print(f"🔄 Retrying with auto-generated return date: {auto_return_date}")
-                            search = GoogleSearch(params)
-                            results = search.get_dict()
+                            results = self._serpapi_get(params)
                             if "error" not in results:
                                 flights = []
                                 if "best_flights" in results:
@@ -611,3 +637,27 @@ class FlightSearchTool:
                 'api_used': 'error_fallback',
                 'error': str(e)
             }
+
+    async def _arun(
+        self,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        return_date: Optional[str] = None,
+        passengers: int = 1,
+        budget_max: Optional[float] = None,
+        use_real_api: bool = True,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Async version of the flight search, run in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(
+            self._run,
+            origin=origin,
+            destination=destination,
+            departure_date=departure_date,
+            return_date=return_date,
+            passengers=passengers,
+            budget_max=budget_max,
+            use_real_api=use_real_api,
+            **kwargs
+        )
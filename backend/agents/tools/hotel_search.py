@@ -1,11 +1,412 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+from dataclasses import dataclass, fields
 from pydantic import BaseModel, Field
 import os
-from datetime import datetime, timedelta
-import json
-import traceback
+import re
+import asyncio
+import copy
+import threading
+import logging
+from datetime import date, datetime, timedelta
 import random
-from serpapi import GoogleSearch
+import zlib
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+from collections import OrderedDict
+import orjson
+from cachetools import TTLCache
+from utils.logger import setup_logger
+from utils.rate_limiter import serpapi_limiter
+from utils.http_client import http_session, SERPAPI_SEARCH_URL
+
+logger = setup_logger()
+
+# Live hotel prices are stable enough to reuse for a while; HOTEL_CACHE_TTL=0 disables caching
+_SEARCH_CACHE_TTL = int(os.getenv("HOTEL_CACHE_TTL", "900"))
+_SEARCH_CACHE_SIZE = 1024
+
+# Searches that just failed or came back empty are not retried for a short while
+_NEGATIVE_CACHE_TTL = int(os.getenv("HOTEL_NEGATIVE_CACHE_TTL", "60"))
+_NEGATIVE_CACHE_SIZE = 512
+
+# Upper bound on searches batch_search runs at once, on top of the SerpAPI rate limiter
+_BATCH_CONCURRENCY = 8
+
+_INR = "INR"
+# The frontend shows a handful of photos per hotel, so larger galleries are truncated
+_MAX_IMAGES = 6
+_PLACEHOLDER_IMAGES = (
+    "https://example.com/hotel_main.jpg",
+    "https://example.com/hotel_room.jpg",
+)
+
+# Country-level destinations mapped to representative cities for sample data
+_COUNTRY_CITIES = {
+    "JAPAN": ("Tokyo", "Kyoto", "Osaka", "Hiroshima", "Nagoya", "Fukuoka"),
+    "INDIA": ("Mumbai", "Delhi", "Bangalore", "Chennai", "Hyderabad", "Jaipur"),
+    "USA": ("New York", "Los Angeles", "Chicago", "Miami", "San Francisco"),
+    "GERMANY": ("Berlin", "Munich", "Frankfurt", "Hamburg", "Cologne", "Dresden"),
+    "UK": ("London", "Manchester", "Edinburgh", "Liverpool", "Glasgow", "Birmingham"),
+    "FRANCE": ("Paris", "Nice", "Lyon", "Marseille", "Bordeaux", "Strasbourg"),
+    "ITALY": ("Rome", "Milan", "Venice", "Florence", "Naples", "Turin"),
+    "SPAIN": ("Madrid", "Barcelona", "Seville", "Valencia", "Malaga", "Bilbao"),
+    "AUSTRALIA": ("Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide", "Gold Coast"),
+    "CHINA": ("Beijing", "Shanghai", "Guangzhou", "Shenzhen", "Xi'an", "Hangzhou"),
+}
+
+_COUNTRY_ALIASES = {
+    "UNITED STATES": "USA",
+    "UNITED KINGDOM": "UK",
+}
+
+@dataclass(slots=True)
+class Hotel:
+    """Structured hotel record, kept as a slotted object until the tool result is serialized"""
+    id: str
+    name: str
+    rating: float
+    star_level: int
+    price_per_night: float
+    currency: str
+    total_price: float
+    amenities: Sequence[str]  # Often a shared module-level tuple; treat as read-only
+    room_type: str
+    location: str
+    address: str
+    distance_to_center: float
+    breakfast_included: bool
+    refundable: bool
+    cancellation_policy: str
+    images: List[str]
+    availability: str
+    reviews_count: int
+    property_type: str
+    value_score: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the plain dict shape used in tool results"""
+        hotel = _HOTEL_SHAPE.copy()
+        for name in _HOTEL_FIELDS:
+            hotel[name] = getattr(self, name)
+        return hotel
+
+# Every hotel dict is cloned from one template so they all share the same key layout
+_HOTEL_FIELDS = tuple(f.name for f in fields(Hotel))
+_HOTEL_SHAPE = dict.fromkeys(_HOTEL_FIELDS)
+
+# First number in a display price such as "₹50,000" or "₹4,250.50"
+_PRICE_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+_STAR_RE = re.compile(r"\d+")
+
+# Sample-data (price range, star range) by accommodation type; anything else is priced as a hotel
+_SAMPLE_TYPE_RANGES = {
+    "hostel": ((800, 2500), (1, 3)),
+    "resort": ((8000, 20000), (3, 5)),
+    "hotel": ((2500, 12000), (2, 5)),
+}
+
+# Sample-data rating ranges keyed by star level, clamped to 2 (and below) through 4 (and above)
+_SAMPLE_RATING_RANGES = {
+    4: (3.8, 4.9),
+    3: (3.0, 4.5),
+    2: (2.5, 4.0),
+}
+
+def _parse_price(value: Any) -> float:
+    """Parse a SerpAPI price field (number, display string or rate dict), 0.0 when there is none"""
+    # Fast path for the current Google Hotels shape, {"extracted_lowest": <number>, "lowest": "₹..."}
+    if type(value) is dict:
+        extracted = value.get("extracted_lowest")
+        if type(extracted) in (int, float):
+            return float(extracted)
+    
+    # Generic path, covering older or drifting response schemas
+    if isinstance(value, dict):
+        # Prefer the pre-extracted number over the display string
+        for key in ("extracted_lowest", "value", "lowest"):
+            if key in value:
+                return _parse_price(value[key])
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        match = _PRICE_RE.search(value)
+        if match:
+            return float(match.group(0).replace(",", ""))
+    return 0.0
+
+def _parse_rating(value: Any, default: float = 4.0) -> float:
+    """Parse a SerpAPI overall_rating (number, numeric string or {"value": ...}), falling back to default"""
+    # Google Hotels currently sends a bare number
+    if type(value) in (int, float):
+        return float(value)
+    try:
+        if isinstance(value, dict) and "value" in value:
+            return float(value["value"])
+        if isinstance(value, str):
+            return float(value.strip())
+    except (ValueError, TypeError):
+        logger.debug("   ⚠️ Could not parse overall_rating: %s", value)
+    return default
+
+def _stable_between(low: int, high: int, *seed: Any) -> int:
+    """Deterministic integer in [low, high] derived from seed, stable across processes unlike hash()"""
+    return low + zlib.crc32("|".join(map(str, seed)).encode()) % (high - low + 1)
+
+def _parse_hotel_class(value: Any) -> int:
+    """Parse a SerpAPI hotel_class value (5, "4", "4-star hotel") into a star level"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        match = _STAR_RE.search(value)
+        return int(match.group()) if match else 3
+    return 3
+
+@lru_cache(maxsize=256)
+def _parse_ymd(value: str) -> datetime:
+    """Parse a YYYY-MM-DD string with the C-level ISO parser, falling back to strptime"""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d")
+
+# Converters from each supported input type to (datetime, "YYYY-MM-DD"), looked up by exact type
+_DATE_COERCERS = {
+    str: lambda v: (_parse_ymd(v), v),
+    datetime: lambda v: (v, v.date().isoformat()),
+    date: lambda v: (datetime(v.year, v.month, v.day), v.isoformat()),
+}
+
+def _coerce_date(value: Any, default: datetime) -> Tuple[datetime, str]:
+    """Normalize a str/date/datetime input to (datetime, "YYYY-MM-DD"), using default if it can't be parsed"""
+    coerce = _DATE_COERCERS.get(type(value))
+    if coerce is None:
+        # Subclasses (e.g. a datetime subclass) resolve through their MRO
+        coerce = next((_DATE_COERCERS[cls] for cls in type(value).__mro__ if cls in _DATE_COERCERS), None)
+    if coerce is None:
+        logger.warning("⚠️ Unsupported date type: %r", type(value))
+        return default, default.date().isoformat()
+    try:
+        return coerce(value)
+    except ValueError:
+        return default, value
+
+# Pools the primary sample generator draws from
+_SAMPLE_HOTEL_NAMES = (
+    "Grand Palace Hotel", "City View Inn", "Comfort Stay",
+    "Luxury Resort & Spa", "Budget Traveler Lodge", "Heritage Hotel",
+    "Modern Suites", "Boutique Hotel", "Business Center Hotel",
+    "Royal Gardens Resort", "Seaside Getaway", "Urban Retreat",
+    "Family Inn & Suites", "Executive Quarters", "Landmark Hotel",
+    "Sunset Resort", "Metro Lodging", "Plaza Premium"
+)
+
+_SAMPLE_AMENITIES_OPTIONS = (
+    ("WiFi", "Pool", "Gym", "Spa", "Restaurant", "Room Service", "Concierge", "Terrace"),
+    ("WiFi", "Breakfast", "Parking", "Room Service", "Bar", "Laundry", "Airport Shuttle"),
+    ("WiFi", "Pool", "Restaurant", "Concierge", "Beach Access", "Kids Club", "Tennis Court"),
+    ("WiFi", "Breakfast", "Gym", "Business Center", "Conference Room", "Parking"),
+    ("WiFi", "Parking", "Pet Friendly", "Restaurant", "Non-smoking Rooms"),
+    ("WiFi", "Room Service", "Laundry", "24-hour Front Desk", "Security"),
+    ("WiFi", "Pool", "Spa", "Fitness Center", "Rooftop Bar", "Restaurant", "Lounge"),
+    ("WiFi", "Restaurant", "Bar", "Meeting Rooms", "Parking", "Express Check-in/out"),
+)
+
+_SAMPLE_ROOM_TYPES = (
+    "Standard Room", "Deluxe Room", "Superior Room", "Executive Room",
+    "Junior Suite", "Suite", "Family Room", "Studio", "Twin Room",
+    "Single Room", "Double Room", "King Room", "Queen Room"
+)
+
+# Amenities assumed for SerpAPI hotels that list none, by star level
+_DEFAULT_AMENITIES_HIGH = ("WiFi", "Pool", "Gym", "Room Service", "Restaurant")
+_DEFAULT_AMENITIES_LOW = ("WiFi", "Parking")
+
+# Wider city pools used for per-hotel display names in the sample generator
+_DISPLAY_CITIES = {
+    "JAPAN": ("Tokyo", "Kyoto", "Osaka", "Hiroshima", "Nara", "Sapporo", "Fukuoka", "Nagoya"),
+    "INDIA": ("Mumbai", "Delhi", "Bangalore", "Chennai", "Hyderabad", "Kolkata", "Jaipur", "Goa"),
+    "USA": ("New York", "Los Angeles", "Chicago", "Miami", "Las Vegas", "San Francisco", "Boston", "Seattle"),
+    "UK": ("London", "Manchester", "Edinburgh", "Glasgow", "Liverpool", "Birmingham", "Oxford", "Cambridge"),
+}
+
+_SAMPLE_AREAS = ("City Center", "Airport Area", "Tourist District", "Business District", "Historic Quarter")
+_SAMPLE_STREETS = ("Main St", "Park Ave", "Beach Road", "Market Lane", "Tourism Road")
+_SAMPLE_CANCELLATION_POLICIES = ("Free cancellation", "Non-refundable", "Cancellation with fee", "24-hour cancellation")
+
+# Country-to-city map for the last-resort fallback generator
+_FALLBACK_COUNTRY_CITIES = {
+    "JAPAN": ("Tokyo", "Kyoto", "Osaka", "Hiroshima", "Fukuoka"),
+    "INDIA": ("Mumbai", "Delhi", "Bangalore", "Chennai", "Jaipur"),
+    "USA": ("New York", "Los Angeles", "Chicago", "San Francisco", "Miami"),
+    "UNITED STATES": ("New York", "Los Angeles", "Chicago", "San Francisco", "Miami"),
+    "UK": ("London", "Manchester", "Edinburgh", "Liverpool", "Glasgow"),
+    "UNITED KINGDOM": ("London", "Manchester", "Edinburgh", "Liverpool", "Glasgow"),
+    "GERMANY": ("Berlin", "Munich", "Frankfurt", "Hamburg", "Cologne"),
+    "FRANCE": ("Paris", "Nice", "Lyon", "Marseille", "Bordeaux"),
+    "SPAIN": ("Madrid", "Barcelona", "Seville", "Valencia", "Malaga"),
+    "ITALY": ("Rome", "Milan", "Venice", "Florence", "Naples"),
+    "AUSTRALIA": ("Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide"),
+    "CANADA": ("Toronto", "Vancouver", "Montreal", "Calgary", "Ottawa"),
+    "CHINA": ("Beijing", "Shanghai", "Guangzhou", "Shenzhen", "Xi'an"),
+    "THAILAND": ("Bangkok", "Phuket", "Chiang Mai", "Pattaya", "Krabi"),
+}
+
+# Fallback hotel names, amenities and room types by category
+_PREMIUM_NAMES = ("Grand Hotel", "Royal Palace", "Luxury Suites", "The Ritz", "Four Seasons")
+_STANDARD_NAMES = ("Comfort Inn", "Best Western", "Holiday Hotel", "City Center Hotel", "Park Plaza")
+_BUDGET_NAMES = ("Budget Stay", "Economy Lodge", "Traveler's Rest", "Value Inn", "Sleep Well")
+
+_PREMIUM_AMENITIES = ("WiFi", "Pool", "Spa", "Fine Dining", "Concierge", "Room Service")
+_STANDARD_AMENITIES = ("WiFi", "Restaurant", "Fitness Center", "Bar", "Breakfast")
+_BUDGET_AMENITIES = ("WiFi", "24-hour Front Desk", "TV", "Air Conditioning")
+
+# Every 3..N-item prefix of each amenity list, so a random amenity count is a single choice
+_PREMIUM_AMENITY_SLICES = tuple(_PREMIUM_AMENITIES[:k] for k in range(3, len(_PREMIUM_AMENITIES) + 1))
+_STANDARD_AMENITY_SLICES = tuple(_STANDARD_AMENITIES[:k] for k in range(3, len(_STANDARD_AMENITIES) + 1))
+_BUDGET_AMENITY_SLICES = tuple(_BUDGET_AMENITIES[:k] for k in range(3, len(_BUDGET_AMENITIES) + 1))
+
+_PREMIUM_ROOM_TYPES = ("Deluxe Suite", "Executive Room", "Premium King")
+_STANDARD_ROOM_TYPES = ("Standard Double", "King Room", "Twin Room")
+_BUDGET_ROOM_TYPES = ("Standard Room", "Economy Double", "Basic Room")
+
+# Fallback hotel categories: (names, price range, star range, rating range, amenity slices, room types)
+_FALLBACK_CATEGORIES = (
+    (_PREMIUM_NAMES, (8000, 25000), (4, 5), (4.0, 4.9), _PREMIUM_AMENITY_SLICES, _PREMIUM_ROOM_TYPES),
+    (_STANDARD_NAMES, (4000, 8000), (3, 4), (3.5, 4.5), _STANDARD_AMENITY_SLICES, _STANDARD_ROOM_TYPES),
+    (_BUDGET_NAMES, (1500, 4000), (2, 3), (3.0, 4.0), _BUDGET_AMENITY_SLICES, _BUDGET_ROOM_TYPES),
+)
+_FALLBACK_CATEGORY_WEIGHTS = (0.3, 0.5, 0.2)  # 30% premium, 50% standard, 20% budget
+
+_FALLBACK_AREAS = ("City Center", "Downtown", "Tourist District", "Business District")
+_FALLBACK_STREETS = ("Main St", "Park Avenue", "Plaza Road", "Central Blvd")
+_FALLBACK_CANCELLATION_POLICIES = ("Free cancellation", "Cancellation with fee", "Non-refundable")
+
+# Fields rendered per hotel by _format_hotels_text, used to key its cache and unpacked
+# positionally by _build_hotels_text, so keep the two in the same order
+_TEXT_FIELDS = attrgetter(
+    "name", "rating", "star_level", "price_per_night", "total_price", "room_type",
+    "location", "distance_to_center", "breakfast_included", "cancellation_policy", "reviews_count"
+)
+_FORMAT_CACHE_SIZE = 64
+
+def _static_value(rating: float, amenity_count: int, amenity_scale: float,
+                  breakfast_included: bool, refundable: bool) -> float:
+    """Price-independent part of a sample hotel's value score, computable while the hotel is built"""
+    return (
+        rating * 0.1 +                               # 50% weight to rating (normalized to 0-1)
+        amenity_count * amenity_scale +              # weight to amenity count
+        (0.1 if breakfast_included else 0) +         # 10% bonus for breakfast
+        (0.05 if refundable else 0)                  # 5% bonus for being refundable
+    )
+
+def _rank_by_value(hotels: List[Hotel], static_scores: List[float], prices: List[float]) -> None:
+    """Add the price term to each hotel's static score, set value_score and sort in place, best value first"""
+    if not hotels:
+        return
+    
+    # The price term needs the batch max, so it is the only part left to the final pass
+    max_price = max(prices) or 1.0
+    scores = [
+        static + (1.0 - price / max_price) * 0.3     # 30% weight to price (inversed, lower is better)
+        for static, price in zip(static_scores, prices)
+    ]
+    
+    for hotel, score in zip(hotels, scores):
+        hotel.value_score = score
+    
+    # Reorder by score index instead of re-reading value_score from every hotel
+    order = sorted(range(len(hotels)), key=scores.__getitem__, reverse=True)
+    hotels[:] = [hotels[i] for i in order]
+
+def _rank_live_hotels(hotels: List[Hotel], price_scale: float) -> None:
+    """Set value_score on SerpAPI hotels and sort the list in place, best value first"""
+    scores = [
+        (h.rating / 5) * 0.5 +                               # 50% weight to rating
+        (1.0 - h.price_per_night / price_scale) * 0.3 +      # 30% weight to price
+        (len(h.amenities) / 8) * 0.15 +                      # 15% weight to amenity count
+        (0.1 if h.breakfast_included else 0) +               # 10% bonus for breakfast
+        (0.05 if h.refundable else 0)                        # 5% bonus for being refundable
+        for h in hotels
+    ]
+    
+    for hotel, score in zip(hotels, scores):
+        hotel.value_score = score
+    
+    order = sorted(range(len(hotels)), key=scores.__getitem__, reverse=True)
+    hotels[:] = [hotels[i] for i in order]
+
+def _price_range(hotels: List[Hotel]) -> Dict[str, float]:
+    """Per-night and total price bounds, gathered in a single pass over the hotels"""
+    if not hotels:
+        # Default price range when no hotels are found
+        return {"min_per_night": 0.0, "max_per_night": 0.0, "min_total": 0.0, "max_total": 0.0}
+    
+    first = hotels[0]
+    min_price = max_price = first.price_per_night
+    min_total = max_total = first.total_price
+    for hotel in hotels:
+        price = hotel.price_per_night
+        total = hotel.total_price
+        if price < min_price:
+            min_price = price
+        elif price > max_price:
+            max_price = price
+        if total < min_total:
+            min_total = total
+        elif total > max_total:
+            max_total = total
+    
+    return {
+        "min_per_night": float(min_price),
+        "max_per_night": float(max_price),
+        "min_total": float(min_total),
+        "max_total": float(max_total)
+    }
+
+# Punctuation and whitespace runs that don't change what a destination or hotel type means
+_QUERY_NOISE_RE = re.compile(r"[\s,.;:!?'\"()-]+")
+
+def _normalize_query_text(value: str) -> str:
+    """Collapse case, whitespace and punctuation so trivially different spellings compare equal"""
+    return _QUERY_NOISE_RE.sub(" ", value).strip().upper()
+
+def _coerce_search_args(guests: Any, rooms: Any, budget_per_night: Any,
+                        star_rating: Any) -> Tuple[int, int, Optional[float], Optional[int]]:
+    """Normalize numeric search arguments once, since agents may pass them as strings"""
+    return (
+        int(guests),
+        int(rooms),
+        float(budget_per_night) if budget_per_night else None,
+        int(star_rating) if star_rating else None,
+    )
+
+def _search_cache_key(location: str, check_in: str, check_out: str, guests: int, rooms: int,
+                      hotel_type: str, star_rating: Optional[int]) -> Tuple:
+    """Canonical SerpAPI cache key, so near-identical searches share one cached response"""
+    place = _normalize_query_text(location)
+    place = _COUNTRY_ALIASES.get(place, place)
+    kind = _normalize_query_text(hotel_type or "hotel").removesuffix("S")
+    return (place, check_in, check_out, int(guests), int(rooms), kind, int(star_rating) if star_rating else None)
+
+def _batch_key(query: Dict[str, Any]) -> Tuple:
+    """Hashable identity of a batch_search query, built on the SerpAPI cache key so spelling variants dedupe"""
+    try:
+        guests, rooms, budget, stars = _coerce_search_args(
+            query.get("guests", 1), query.get("rooms", 1),
+            query.get("budget_per_night"), query.get("star_rating"),
+        )
+    except (TypeError, ValueError):
+        # Malformed arguments are left for _run to report; such queries only match exact repeats
+        return tuple(sorted((name, repr(value)) for name, value in query.items()))
+    check_in, check_out = (
+        _coerce_date(value, datetime.min)[1] if value is not None else None
+        for value in (query.get("check_in_date"), query.get("check_out_date"))
+    )
+    search_key = _search_cache_key(str(query.get("location", "")), check_in, check_out,
+                                   guests, rooms, query.get("hotel_type", "hotel"), stars)
+    return search_key + (budget, bool(query.get("use_real_api", True)))
 
 class HotelSearchInput(BaseModel):
     """Input for hotel search tool"""
@@ -28,25 +429,44 @@ class HotelSearchTool:
         Provides hotel data including prices, amenities, and location details.
         Uses SerpAPI Google Hotels when real API is enabled, otherwise uses sample data."""
         
+        # Recently formatted LLM summaries, keyed by the rendered hotel fields
+        self._format_cache = OrderedDict()
+        self._format_cache_lock = threading.Lock()
+        
+        # Raw SerpAPI properties per normalized query, expired after _SEARCH_CACHE_TTL seconds
+        self._search_cache = TTLCache(maxsize=_SEARCH_CACHE_SIZE, ttl=_SEARCH_CACHE_TTL) if _SEARCH_CACHE_TTL > 0 else None
+        self._search_cache_lock = threading.Lock()
+        self._negative_cache = TTLCache(maxsize=_NEGATIVE_CACHE_SIZE, ttl=_NEGATIVE_CACHE_TTL) if _NEGATIVE_CACHE_TTL > 0 else None
+        
         # Initialize API keys
         self.serpapi_key = os.getenv('SERPAPI_API_KEY')
         if not self.serpapi_key:
-            print("⚠️ SerpAPI key not found for hotel search. Using sample data only.")
+            logger.warning("⚠️ SerpAPI key not found for hotel search. Using sample data only.")
         else:
-            print("✅ SerpAPI initialized for Google Hotels search")
+            logger.info("✅ SerpAPI initialized for Google Hotels search")
     
     def _search_serpapi_hotels(self, location: str, check_in_date: str, check_out_date: str, 
                              guests: int, rooms: int, hotel_type: str = "hotel",
                              star_rating: Optional[int] = None) -> List[Dict]:
         """Search hotels using SerpAPI Google Hotels"""
         if not self.serpapi_key:
-            print("❌ SerpAPI key not available for hotel search, using fallback.")
+            logger.warning("❌ SerpAPI key not available for hotel search, using fallback.")
             return []
         
+        # Ensure dates are strings in YYYY-MM-DD format
+        check_in, check_in_date_str = _coerce_date(check_in_date, default=datetime.now())
+        _, check_out_date_str = _coerce_date(check_out_date, default=check_in + timedelta(days=3))
+        
+        cache_key = _search_cache_key(location, check_in_date_str, check_out_date_str,
+                                      guests, rooms, hotel_type, star_rating)
+        
         try:
-            # Ensure dates are strings in YYYY-MM-DD format
-            check_in_date_str = check_in_date.strftime('%Y-%m-%d') if hasattr(check_in_date, 'strftime') else str(check_in_date)
-            check_out_date_str = check_out_date.strftime('%Y-%m-%d') if hasattr(check_out_date, 'strftime') else str(check_out_date)
+            if self._search_cache is not None:
+                with self._search_cache_lock:
+                    cached = self._search_cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("♻️ Reusing cached SerpAPI hotel results for %s", location)
+                    return list(cached)
             
             # Build SerpAPI parameters for Google Hotels
             params = {
@@ -64,16 +484,22 @@ class HotelSearchTool:
             if star_rating:
                 params["min_rating"] = star_rating
                 
-            print(f"🔍 Calling SerpAPI Google Hotels with: {location} from {check_in_date_str} to {check_out_date_str}")
-            print(f"🔍 SerpAPI params: {params}")
+            logger.info("🔍 Calling SerpAPI Google Hotels with: %s from %s to %s", location, check_in_date_str, check_out_date_str)
+            
+            # Wait for a rate-limit token so bursts queue instead of hitting 429s
+            waited = serpapi_limiter.acquire()
+            if waited:
+                logger.debug("SerpAPI rate limiter delayed hotel search by %.2fs", waited)
             
-            # Make the search request
-            search = GoogleSearch(params)
-            results = search.get_dict()
+            # Make the search request over the shared session
+            response = http_session.get(SERPAPI_SEARCH_URL, params=params, timeout=(3, 15))
+            # orjson parses the raw bytes directly, skipping the decode to str
+            results = orjson.loads(response.content)
             
             if "error" in results:
-                print(f"❌ SerpAPI error: {results['error']}")
-                print(f"📝 Full error response: {results}")
+                logger.error("❌ SerpAPI error: %s", results['error'])
+                logger.debug("📝 Full error response: %s", results)
+                self._remember_failed_search(cache_key)
                 return []
                 
             # Extract hotels from results
@@ -81,215 +507,133 @@ class HotelSearchTool:
             if "properties" in results:
                 hotels.extend(results["properties"])
                 
-            print(f"✅ SerpAPI returned {len(hotels)} hotel options")
+            logger.info("✅ SerpAPI returned %d hotel options", len(hotels))
+            if not hotels:
+                self._remember_failed_search(cache_key)
+            elif self._search_cache is not None:
+                with self._search_cache_lock:
+                    self._search_cache[cache_key] = tuple(hotels)
             return hotels
             
         except Exception as e:
-            print(f"❌ Error searching SerpAPI hotels: {e}")
-            traceback.print_exc()
+            logger.error("❌ Error searching SerpAPI hotels: %s", e, exc_info=True)
+            self._remember_failed_search(cache_key)
             return []
     
-    def _format_serpapi_results(self, serpapi_results: List[Dict], budget_max: Optional[float] = None) -> List[Dict]:
+    def _remember_failed_search(self, cache_key: Tuple) -> None:
+        """Record a search that errored or returned nothing so immediate retries skip SerpAPI"""
+        if self._negative_cache is not None:
+            with self._search_cache_lock:
+                self._negative_cache[cache_key] = True
+    
+    def _recently_failed(self, cache_key: Tuple) -> bool:
+        """Whether this search errored or came back empty within the negative cache TTL"""
+        if self._negative_cache is None:
+            return False
+        with self._search_cache_lock:
+            return cache_key in self._negative_cache
+    
+    def _extract_price_per_night(self, hotel: Dict, hotel_class: int, name: str) -> float:
+        """Extract the nightly price from a SerpAPI hotel, estimating one from the hotel class if missing"""
+        # Try different price fields in the Google Hotels API response
+        price_per_night = 0
+        
+        # Check for pricing information in different possible locations
+        rate_per_night = hotel.get("rate_per_night")
+        if rate_per_night:
+            logger.debug("   Found rate_per_night: %s", rate_per_night)
+            price_per_night = _parse_price(rate_per_night)
+        
+        # If no price yet, try "total_rate" spread over the default 3-night stay
+        total_rate = hotel.get("total_rate")
+        if price_per_night == 0 and total_rate:
+            logger.debug("   Found total_rate: %s", total_rate)
+            price_per_night = _parse_price(total_rate) / 3
+        
+        # If still no price, use a reasonable default based on hotel class
+        if price_per_night == 0:
+            logger.debug("   ⚠️ No price found in API response, using default pricing")
+            if hotel_class >= 5:
+                price_per_night = 15000 + _stable_between(5000, 15000, name, "price")
+            elif hotel_class >= 4:
+                price_per_night = 8000 + _stable_between(2000, 7000, name, "price")
+            elif hotel_class >= 3:
+                price_per_night = 5000 + _stable_between(1000, 3000, name, "price")
+            else:
+                price_per_night = 3000 + _stable_between(500, 1500, name, "price")
+        
+        return float(price_per_night)
+    
+    def _format_serpapi_results(self, serpapi_results: List[Dict], budget_max: Optional[float] = None) -> List[Hotel]:
         """Format SerpAPI hotel results into structured data for frontend"""
         
-        print(f"🔍 _format_serpapi_results called with {len(serpapi_results)} hotels")
+        logger.debug("🔍 _format_serpapi_results called with %d hotels", len(serpapi_results))
         if budget_max:
-            print(f"🔍 Budget max: {budget_max}")
+            logger.debug("🔍 Budget max: %s", budget_max)
             
         # Check if we need to inspect the structure of the results
-        if serpapi_results and len(serpapi_results) > 0:
-            sample_keys = list(serpapi_results[0].keys())
-            print(f"📋 Sample hotel keys: {sample_keys}")
-        
-        structured_hotels = []
+        if serpapi_results:
+            logger.debug("📋 Sample hotel keys: %s", list(serpapi_results[0]))
         
+        # First pass: parse only the price so over-budget hotels are rejected
+        # before any of the heavier field extraction happens
+        candidates = []
+        budget_limit = budget_max or float("inf")
         for i, hotel in enumerate(serpapi_results):
             try:
-                print(f"🔍 Processing hotel {i+1}:")
-                
-                # Extract hotel information
-                name = hotel.get("name", f"Hotel {i+1}")
+                logger.debug("🔍 Processing hotel %d:", i + 1)
                 
                 # First, log the complete hotel data for debugging the first hotel only
-                if i == 0:
-                    print(f"DEBUG HOTEL STRUCTURE: {json.dumps(hotel, indent=2, default=str)}")
-                
-                # Try different price fields in the Google Hotels API response
-                price_per_night = 0
-                
-                # Check for pricing information in different possible locations
-                if "rate_per_night" in hotel and hotel["rate_per_night"]:
-                    price_field = hotel["rate_per_night"]
-                    print(f"   Found rate_per_night: {price_field}")
-                    
-                    # Check for extracted_lowest in dict (from SerpAPI)
-                    if isinstance(price_field, dict):
-                        if "extracted_lowest" in price_field:
-                            price_per_night = float(price_field["extracted_lowest"])
-                        elif "value" in price_field:
-                            price_per_night = float(price_field["value"])
-                        elif "lowest" in price_field:
-                            try:
-                                # Extract digits from string like "₹50,000"
-                                lowest = price_field["lowest"]
-                                clean_price = ''.join(c for c in lowest if c.isdigit())
-                                if clean_price:
-                                    price_per_night = float(clean_price)
-                            except:
-                                pass
-                    elif isinstance(price_field, (int, float)):
-                        price_per_night = float(price_field)
-                    elif isinstance(price_field, str):
-                        # Extract numeric value from string like "₹50,000"
-                        try:
-                            # Remove currency symbols, commas, and non-numeric characters
-                            clean_price = ''.join(c for c in price_field if c.isdigit() or c == '.')
-                            if clean_price:
-                                price_per_night = float(clean_price)
-                        except:
-                            print(f"   ⚠️ Could not parse rate_per_night: {price_field}")
-                
-                # If no price yet, try "total_rate"
-                if price_per_night == 0 and "total_rate" in hotel and hotel["total_rate"]:
-                    price_field = hotel["total_rate"]
-                    print(f"   Found total_rate: {price_field}")
-                    
-                    # Try to extract the total rate and divide by nights to get per night
-                    nights = 3  # Default to 3 nights if not specified
-                    
-                    # Check for extracted_lowest in dict (from SerpAPI)
-                    if isinstance(price_field, dict):
-                        if "extracted_lowest" in price_field:
-                            total_price = float(price_field["extracted_lowest"])
-                            price_per_night = total_price / nights
-                        elif "value" in price_field:
-                            total_price = float(price_field["value"])
-                            price_per_night = total_price / nights
-                        elif "lowest" in price_field:
-                            try:
-                                # Extract digits from string like "₹50,000"
-                                lowest = price_field["lowest"]
-                                clean_price = ''.join(c for c in lowest if c.isdigit())
-                                if clean_price:
-                                    total_price = float(clean_price)
-                                    price_per_night = total_price / nights
-                            except:
-                                pass
-                    elif isinstance(price_field, (int, float)):
-                        total_price = float(price_field)
-                        price_per_night = total_price / nights
-                    elif isinstance(price_field, str):
-                        try:
-                            # Remove currency symbols, commas, and non-numeric characters
-                            clean_price = ''.join(c for c in price_field if c.isdigit() or c == '.')
-                            if clean_price:
-                                total_price = float(clean_price)
-                                price_per_night = total_price / nights
-                        except:
-                            print(f"   ⚠️ Could not parse total_rate: {price_field}")
-                
-                # If still no price, look for other price fields or use a reasonable default
-                if price_per_night == 0:
-                    print(f"   ⚠️ No price found in API response, using default pricing")
-                    # Use a reasonable default based on hotel class
-                    hotel_class = hotel.get("hotel_class", 0)
-                    if isinstance(hotel_class, str) and hotel_class.isdigit():
-                        hotel_class = int(hotel_class)
-                    elif not isinstance(hotel_class, (int, float)):
-                        hotel_class = 3
-                        
-                    # Base price on hotel class
-                    if hotel_class >= 5:
-                        price_per_night = 15000 + (random.randint(5000, 15000))
-                    elif hotel_class >= 4:
-                        price_per_night = 8000 + (random.randint(2000, 7000))
-                    elif hotel_class >= 3:
-                        price_per_night = 5000 + (random.randint(1000, 3000))
-                    else:
-                        price_per_night = 3000 + (random.randint(500, 1500))
+                if i == 0 and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("DEBUG HOTEL STRUCTURE: %s", orjson.dumps(hotel, default=str, option=orjson.OPT_INDENT_2).decode())
                 
-                # If we still have no price, generate a reasonable price based on the hotel star level
-                if price_per_night == 0:
-                    # Extract star level for price estimation
-                    star_level = 3  # Default
-                    
-                    if "hotel_class" in hotel and hotel["hotel_class"]:
-                        try:
-                            star_level = int(float(hotel["hotel_class"]))
-                        except:
-                            # Try to extract digits
-                            if isinstance(hotel["hotel_class"], str):
-                                digit_chars = [c for c in hotel["hotel_class"] if c.isdigit()]
-                                if digit_chars:
-                                    star_level = int(digit_chars[0])
-                    
-                    # Generate price based on star rating
-                    if star_level >= 5:
-                        price_per_night = random.randint(15000, 30000)
-                    elif star_level == 4:
-                        price_per_night = random.randint(6000, 15000)
-                    elif star_level == 3:
-                        price_per_night = random.randint(3000, 6000)
-                    else:
-                        price_per_night = random.randint(1000, 3000)
-                    
-                    print(f"   ⚠️ No price found, generated price: ₹{price_per_night:,.0f}")
-                
-                print(f"   💰 Price: ₹{price_per_night:,.0f}")
+                # Parse the hotel class once; it feeds both the price fallback and star_level
+                name = hotel.get("name", f"Hotel {i+1}")
+                hotel_class = _parse_hotel_class(hotel.get("hotel_class"))
+                price_per_night = self._extract_price_per_night(hotel, hotel_class, name)
+                logger.debug("   💰 Price: ₹%.0f", price_per_night)
                 
                 # Apply budget filter
-                if budget_max and price_per_night > budget_max:
-                    print(f"   ❌ Hotel exceeds budget limit (₹{budget_max:,.0f})")
+                if price_per_night > budget_limit:
+                    logger.debug("   ❌ Hotel exceeds budget limit (₹%.0f)", budget_max)
                     continue
                 else:
-                    print(f"   ✅ Hotel within budget")
+                    logger.debug("   ✅ Hotel within budget")
                 
+                candidates.append((i, hotel, name, price_per_night, hotel_class))
+                
+            except Exception as e:
+                logger.error("❌ Error processing hotel %d: %s", i + 1, e, exc_info=True)
+                continue
+        
+        if not candidates:
+            logger.info("🎯 FINAL: no hotels within budget")
+            return []
+        
+        # Second pass: build the full hotel records for hotels within budget
+        structured_hotels = []
+        
+        for i, hotel, name, price_per_night, star_level in candidates:
+            try:
                 # Extract rating (overall_rating in Google Hotels API)
-                rating = 4.0  # Default
-                if "overall_rating" in hotel:
-                    try:
-                        # The rating might be in a nested structure or direct
-                        if isinstance(hotel["overall_rating"], dict) and "value" in hotel["overall_rating"]:
-                            rating = float(hotel["overall_rating"]["value"])
-                        elif isinstance(hotel["overall_rating"], (int, float)):
-                            rating = float(hotel["overall_rating"])
-                        elif isinstance(hotel["overall_rating"], str):
-                            rating = float(hotel["overall_rating"].strip())
-                    except (ValueError, TypeError):
-                        print(f"   ⚠️ Could not parse overall_rating: {hotel.get('overall_rating')}")
-                print(f"   ⭐ Rating: {rating}")
+                rating = _parse_rating(hotel.get("overall_rating"))
+                logger.debug("   ⭐ Rating: %s", rating)
                 
-                # Extract star level (hotel_class in Google Hotels API)
-                star_level = 3  # Default
-                if "hotel_class" in hotel:
-                    try:
-                        # The class might be in different formats
-                        if isinstance(hotel["hotel_class"], (int, float)):
-                            star_level = int(hotel["hotel_class"])
-                        elif isinstance(hotel["hotel_class"], str) and hotel["hotel_class"].isdigit():
-                            star_level = int(hotel["hotel_class"])
-                        # Handle "4-star hotel" format
-                        elif isinstance(hotel["hotel_class"], str) and "-star" in hotel["hotel_class"].lower():
-                            star_text = hotel["hotel_class"].lower().split("-star")[0].strip()
-                            if star_text.isdigit():
-                                star_level = int(star_text)
-                    except (ValueError, TypeError):
-                        print(f"   ⚠️ Could not parse hotel_class: {hotel.get('hotel_class')}")
-                print(f"   ⭐ Star Level: {star_level}")
+                logger.debug("   ⭐ Star Level: %s", star_level)
                 
                 # Extract location and address
                 address = hotel.get("address", "")
                 hotel_location = address  # Use address as the location
-                print(f"   📍 Address: {address}")
+                logger.debug("   📍 Address: %s", address)
                 
                 # Extract neighborhood or area if available
-                nearby_places = hotel.get("nearby_places", [])
-                if isinstance(nearby_places, list) and nearby_places:
+                nearby_places = hotel.get("nearby_places")
+                if nearby_places and isinstance(nearby_places, list):
                     # Get the closest nearby place for neighborhood info
                     neighborhood = nearby_places[0].get("name", "") if isinstance(nearby_places[0], dict) else ""
                     if neighborhood:
                         hotel_location = f"{neighborhood}, {hotel_location}"
-                        print(f"   🏙️ Neighborhood: {neighborhood}")
+                        logger.debug("   🏙️ Neighborhood: %s", neighborhood)
                 
                 # Google Hotels API often has a gps_coordinates field
                 gps_coords = hotel.get("gps_coordinates", {})
@@ -297,22 +641,20 @@ class HotelSearchTool:
                     latitude = gps_coords.get("latitude")
                     longitude = gps_coords.get("longitude")
                     if latitude and longitude:
-                        print(f"   🌐 Coordinates: {latitude}, {longitude}")
+                        logger.debug("   🌐 Coordinates: %s, %s", latitude, longitude)
                 
                 # Extract amenities - Google Hotels API has this as a list in "amenities"
-                amenities = []
-                if "amenities" in hotel and isinstance(hotel["amenities"], list):
-                    amenities = hotel["amenities"]
-                    print(f"   🛎️ Found {len(amenities)} amenities")
-                elif "amenities" in hotel and isinstance(hotel["amenities"], str):
-                    amenities = [a.strip() for a in hotel["amenities"].split(',')]
+                raw_amenities = hotel.get("amenities")
+                if isinstance(raw_amenities, list):
+                    amenities = raw_amenities[:8]
+                    logger.debug("   🛎️ Found %d amenities", len(raw_amenities))
+                elif isinstance(raw_amenities, str):
+                    # Only the first 8 are kept, so stop splitting once those are found
+                    amenities = list(map(str.strip, raw_amenities.split(',', 8)[:8]))
                 else:
                     # Default amenities based on star level
-                    if star_level >= 4:
-                        amenities = ["WiFi", "Pool", "Gym", "Room Service", "Restaurant"]
-                    else:
-                        amenities = ["WiFi", "Parking"]
-                    print(f"   ⚠️ No amenities found, using defaults: {amenities}")
+                    amenities = _DEFAULT_AMENITIES_HIGH if star_level >= 4 else _DEFAULT_AMENITIES_LOW
+                    logger.debug("   ⚠️ No amenities found, using defaults: %s", amenities)
                 
                 # Extract images - Google Hotels API structure
                 images = []
@@ -322,89 +664,74 @@ class HotelSearchTool:
                     thumbnail_url = hotel["thumbnail"]
                     if isinstance(thumbnail_url, str):
                         images.append(thumbnail_url)
-                        print(f"   🖼️ Found thumbnail")
+                        logger.debug("   🖼️ Found thumbnail")
                 
                 # Try to get images list
                 if "images" in hotel:
                     hotel_images = hotel["images"]
                     if isinstance(hotel_images, list):
                         for img in hotel_images:
+                            if len(images) >= _MAX_IMAGES:
+                                break
                             if isinstance(img, str):
                                 images.append(img)
                             elif isinstance(img, dict) and "link" in img:
                                 images.append(img["link"])
-                        print(f"   🖼️ Found {len(images) - (1 if 'thumbnail' in hotel and hotel['thumbnail'] else 0)} additional images")
+                        logger.debug("   🖼️ Found %d additional images", len(images) - (1 if 'thumbnail' in hotel and hotel['thumbnail'] else 0))
                     elif isinstance(hotel_images, dict) and "link" in hotel_images:
                         images.append(hotel_images["link"])
-                        print(f"   🖼️ Found 1 image")
+                        logger.debug("   🖼️ Found 1 image")
                 
                 if not images:
                     # Add placeholder images if none found
-                    images = [
-                        f"https://example.com/hotel_{i+1}_main.jpg",
-                        f"https://example.com/hotel_{i+1}_room.jpg"
-                    ]
-                    print("   ⚠️ No images found, using placeholder images")
+                    images = list(_PLACEHOLDER_IMAGES)
+                    logger.debug("   ⚠️ No images found, using placeholder images")
                 
                 # Calculate total price for the stay
                 nights = hotel.get("nights", 1)
                 rooms_count = hotel.get("rooms", 1)
-                total_price = price_per_night * nights * rooms_count
+                total_price = float(price_per_night * nights * rooms_count)
                 
                 # Create structured hotel data
-                hotel_data = {
-                    'id': f"hotel_{i+1}",
-                    'name': name,
-                    'rating': float(rating),  # Ensure float for serialization
-                    'star_level': int(star_level),  # Ensure int for serialization
-                    'price_per_night': float(price_per_night),  # Ensure float for serialization
-                    'currency': "INR",
-                    'total_price': float(total_price),  # Ensure float for serialization
-                    'amenities': amenities[:8],  # Limit to 8 amenities for consistency
-                    'room_type': hotel.get("room_type", "Standard Room"),
-                    'location': hotel_location,
-                    'address': hotel.get("address", ""),
-                    'distance_to_center': float(hotel.get("distance_to_center", random.uniform(0.2, 8.0))),
-                    'breakfast_included': hotel.get("breakfast_included", random.choice([True, False])),
-                    'refundable': hotel.get("refundable", random.choice([True, False])),
-                    'cancellation_policy': hotel.get("cancellation_policy", "Free cancellation"),
-                    'images': images,
-                    'availability': "Available",
-                    'reviews_count': hotel.get("reviews_count", random.randint(50, 2000)),
-                    'property_type': hotel.get("property_type", "Hotel").capitalize()
-                }
-                
-                # Calculate a value score for sorting
-                price_factor = 1.0 - (hotel_data["price_per_night"] / (budget_max or 15000))
-                amenities_factor = len(hotel_data["amenities"]) / 8
-                breakfast_factor = 0.1 if hotel_data["breakfast_included"] else 0
-                
-                # Combined score with weights
-                hotel_data["value_score"] = (
-                    (hotel_data["rating"] / 5) * 0.5 +  # 50% weight to rating
-                    price_factor * 0.3 +               # 30% weight to price
-                    amenities_factor * 0.15 +          # 15% weight to amenity count
-                    breakfast_factor +                 # 10% bonus for breakfast
-                    (0.05 if hotel_data["refundable"] else 0)  # 5% bonus for being refundable
+                hotel_data = Hotel(
+                    id=f"hotel_{i+1}",
+                    name=name,
+                    rating=rating,  # _parse_rating always returns a float
+                    star_level=star_level,  # _parse_hotel_class always returns an int
+                    price_per_night=price_per_night,  # _extract_price_per_night always returns a float
+                    currency=_INR,
+                    total_price=total_price,
+                    amenities=amenities,  # Already limited to 8 amenities for consistency
+                    room_type=hotel.get("room_type", "Standard Room"),
+                    location=hotel_location,
+                    address=hotel.get("address", ""),
+                    # Fields SerpAPI rarely returns default to values derived from the hotel name,
+                    # so the same hotel looks the same on every search
+                    distance_to_center=float(hotel["distance_to_center"] if "distance_to_center" in hotel else _stable_between(200, 8000, name, "distance") / 1000),
+                    breakfast_included=hotel.get("breakfast_included", bool(_stable_between(0, 1, name, "breakfast"))),
+                    refundable=hotel.get("refundable", bool(_stable_between(0, 1, name, "refundable"))),
+                    cancellation_policy=hotel.get("cancellation_policy", "Free cancellation"),
+                    images=images,
+                    availability="Available",
+                    reviews_count=hotel.get("reviews_count", _stable_between(50, 2000, name, "reviews")),
+                    property_type=hotel.get("property_type", "Hotel").capitalize()
                 )
                 
-                print(f"   ✅ Added hotel: {hotel_data['name']} - ₹{hotel_data['price_per_night']:,.0f}")
+                logger.debug("   ✅ Added hotel: %s - ₹%.0f", hotel_data.name, hotel_data.price_per_night)
                 structured_hotels.append(hotel_data)
                 
             except Exception as e:
-                print(f"❌ Error processing hotel {i+1}: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.error("❌ Error processing hotel %d: %s", i + 1, e, exc_info=True)
                 continue
         
-        # Sort by our computed value score (higher is better)
-        structured_hotels.sort(key=lambda x: -x['value_score'])
-        print(f"🎯 FINAL: {len(structured_hotels)} hotels structured and sorted by value score")
+        # Score against the budget (or a ₹15,000 reference) and sort, higher is better
+        _rank_live_hotels(structured_hotels, price_scale=budget_max or 15000)
+        logger.info("🎯 FINAL: %d hotels structured and sorted by value score", len(structured_hotels))
         
-        if structured_hotels:
-            print("📋 Final hotel list:")
+        if structured_hotels and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📋 Final hotel list:")
             for i, hotel in enumerate(structured_hotels[:5]):
-                print(f"   {i+1}. {hotel['name']} - ₹{hotel['price_per_night']:,.0f}/night (Rating: {hotel['rating']})")
+                logger.debug("   %d. %s - ₹%s/night (Rating: %s)", i + 1, hotel.name, f"{hotel.price_per_night:,.0f}", hotel.rating)
         
         return structured_hotels
 
@@ -422,26 +749,44 @@ class HotelSearchTool:
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """Execute the hotel search and return structured data"""
+        guests, rooms, budget_per_night, star_rating = _coerce_search_args(guests, rooms, budget_per_night, star_rating)
+        
+        logger.info("🏨 Starting hotel search for %s", location)
+        logger.debug("📅 Check-in: %s, Check-out: %s", check_in_date, check_out_date)
+        logger.debug("👥 Guests: %s, Rooms: %s", guests, rooms)
+        logger.debug("💰 Budget: %s, Type: %s", budget_per_night, hotel_type)
+        logger.debug("✨ Star Rating: %s", star_rating or 'Any')
         
-        print(f"🏨 Starting hotel search for {location}")
-        print(f"📅 Check-in: {check_in_date}, Check-out: {check_out_date}")
-        print(f"👥 Guests: {guests}, Rooms: {rooms}")
-        print(f"💰 Budget: {budget_per_night}, Type: {hotel_type}")
-        print(f"✨ Star Rating: {star_rating if star_rating else 'Any'}")
+        logger.debug("🔄 API Mode: %s", 'Real API' if use_real_api else 'Sample Data')
         
-        print(f"🔄 API Mode: {'Real API' if use_real_api else 'Sample Data'}")
+        # Parse dates once up front; nights is shared by every generated hotel and the
+        # date strings keep the response JSON-serializable
+        check_in, check_in_date_str = _coerce_date(check_in_date, default=datetime.now())
+        check_out, check_out_date_str = _coerce_date(check_out_date, default=check_in + timedelta(days=3))
+        # Count calendar nights from day ordinals; a check-out time earlier than check-in still counts
+        nights = max(1, check_out.toordinal() - check_in.toordinal())
+        logger.debug("✅ Calculated %d nights from %s to %s", nights, check_in_date_str, check_out_date_str)
         
         hotels = []
         api_used = "sample"
         
+        # Per-search values shared by every generated hotel
+        property_type = hotel_type.capitalize()
+        min_stars = star_rating or 0
+        
         try:
-            if use_real_api and self.serpapi_key:
-                print("🌐 Using real SerpAPI for hotel search")
+            search_key = _search_cache_key(location, check_in_date_str, check_out_date_str,
+                                           guests, rooms, hotel_type, star_rating)
+            if use_real_api and self.serpapi_key and self._recently_failed(search_key):
+                logger.info("⏭️ Skipping SerpAPI, this search failed moments ago; using sample data")
+                api_used = "serpapi_neg_cache"
+            elif use_real_api and self.serpapi_key:
+                logger.debug("🌐 Using real SerpAPI for hotel search")
                 # Use real API call
                 serpapi_results = self._search_serpapi_hotels(
                     location=location,
-                    check_in_date=check_in_date,
-                    check_out_date=check_out_date,
+                    check_in_date=check_in_date_str,
+                    check_out_date=check_out_date_str,
                     guests=guests,
                     rooms=rooms,
                     hotel_type=hotel_type,
@@ -449,133 +794,96 @@ class HotelSearchTool:
                 )
                 
                 if serpapi_results:
-                    print(f"✅ SerpAPI returned {len(serpapi_results)} hotels")
+                    logger.debug("✅ SerpAPI returned %d hotels", len(serpapi_results))
                     hotels = self._format_serpapi_results(serpapi_results, budget_max=budget_per_night)
                     api_used = "serpapi"
                 else:
-                    print("⚠️ SerpAPI returned no results, falling back to sample data")
+                    logger.warning("⚠️ SerpAPI returned no results, falling back to sample data")
                     api_used = "serpapi_fallback"
             else:
-                print("⚠️ Using sample hotel data")
+                logger.debug("⚠️ Using sample hotel data")
                 api_used = "sample"
-            
-            # If we didn't get hotels from the API (either not requested or failed), generate sample data
-            if not hotels:
-                print("🏨 Generating sample hotel data")
-                # Mock hotel data
         except Exception as e:
-            print(f"❌ Error in hotel search API: {e}")
-            traceback.print_exc()
+            logger.error("❌ Error in hotel search API: %s", e, exc_info=True)
             api_used = "error_fallback"
-            hotel_names = [
-                "Grand Palace Hotel", "City View Inn", "Comfort Stay", 
-                "Luxury Resort & Spa", "Budget Traveler Lodge", "Heritage Hotel",
-                "Modern Suites", "Boutique Hotel", "Business Center Hotel",
-                "Royal Gardens Resort", "Seaside Getaway", "Urban Retreat",
-                "Family Inn & Suites", "Executive Quarters", "Landmark Hotel",
-                "Sunset Resort", "Metro Lodging", "Plaza Premium"
-            ]
-            
-            amenities_options = [
-                ["WiFi", "Pool", "Gym", "Spa", "Restaurant", "Room Service", "Concierge", "Terrace"],
-                ["WiFi", "Breakfast", "Parking", "Room Service", "Bar", "Laundry", "Airport Shuttle"],
-                ["WiFi", "Pool", "Restaurant", "Concierge", "Beach Access", "Kids Club", "Tennis Court"],
-                ["WiFi", "Breakfast", "Gym", "Business Center", "Conference Room", "Parking"],
-                ["WiFi", "Parking", "Pet Friendly", "Restaurant", "Non-smoking Rooms"],
-                ["WiFi", "Room Service", "Laundry", "24-hour Front Desk", "Security"],
-                ["WiFi", "Pool", "Spa", "Fitness Center", "Rooftop Bar", "Restaurant", "Lounge"],
-                ["WiFi", "Restaurant", "Bar", "Meeting Rooms", "Parking", "Express Check-in/out"]
-            ]
-            
-            room_types = [
-                "Standard Room", "Deluxe Room", "Superior Room", "Executive Room",
-                "Junior Suite", "Suite", "Family Room", "Studio", "Twin Room",
-                "Single Room", "Double Room", "King Room", "Queen Room"
-            ]
+        
+        # Only generate sample data when live results weren't used (not requested, empty or failed)
+        if api_used != "serpapi":
+            logger.debug("🏨 Generating sample hotel data")
             
             # Handle country-level destinations by mapping to specific cities
             location_display = location
             hotel_location = location
             
             # Common country to city mappings for sample data
-            if location.upper() in ["JAPAN", "TOKYO", "KYOTO", "OSAKA"]:
-                cities = ["Tokyo", "Kyoto", "Osaka", "Hiroshima", "Nagoya", "Fukuoka"]
-                hotel_location = random.choice(cities) if location.upper() == "JAPAN" else location
-            elif location.upper() in ["INDIA", "DELHI", "MUMBAI", "BANGALORE"]:
-                cities = ["Mumbai", "Delhi", "Bangalore", "Chennai", "Hyderabad", "Jaipur"]
-                hotel_location = random.choice(cities) if location.upper() == "INDIA" else location
-            elif location.upper() in ["USA", "UNITED STATES", "NEW YORK", "LOS ANGELES"]:
-                cities = ["New York", "Los Angeles", "Chicago", "Miami", "San Francisco"]
-                hotel_location = random.choice(cities) if location.upper() in ["USA", "UNITED STATES"] else location
-            elif location.upper() in ["GERMANY", "BERLIN", "MUNICH", "FRANKFURT"]:
-                cities = ["Berlin", "Munich", "Frankfurt", "Hamburg", "Cologne", "Dresden"]
-                hotel_location = random.choice(cities) if location.upper() == "GERMANY" else location
-            elif location.upper() in ["UK", "UNITED KINGDOM", "LONDON", "MANCHESTER"]:
-                cities = ["London", "Manchester", "Edinburgh", "Liverpool", "Glasgow", "Birmingham"]
-                hotel_location = random.choice(cities) if location.upper() in ["UK", "UNITED KINGDOM"] else location
-            elif location.upper() in ["FRANCE", "PARIS", "NICE", "LYON"]:
-                cities = ["Paris", "Nice", "Lyon", "Marseille", "Bordeaux", "Strasbourg"]
-                hotel_location = random.choice(cities) if location.upper() == "FRANCE" else location
-            elif location.upper() in ["ITALY", "ROME", "MILAN", "VENICE"]:
-                cities = ["Rome", "Milan", "Venice", "Florence", "Naples", "Turin"]
-                hotel_location = random.choice(cities) if location.upper() == "ITALY" else location
-            elif location.upper() in ["SPAIN", "MADRID", "BARCELONA", "SEVILLE"]:
-                cities = ["Madrid", "Barcelona", "Seville", "Valencia", "Malaga", "Bilbao"]
-                hotel_location = random.choice(cities) if location.upper() == "SPAIN" else location
-            elif location.upper() in ["AUSTRALIA", "SYDNEY", "MELBOURNE", "BRISBANE"]:
-                cities = ["Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide", "Gold Coast"]
-                hotel_location = random.choice(cities) if location.upper() == "AUSTRALIA" else location
-            elif location.upper() in ["CHINA", "BEIJING", "SHANGHAI", "GUANGZHOU"]:
-                cities = ["Beijing", "Shanghai", "Guangzhou", "Shenzhen", "Xi'an", "Hangzhou"]
-                hotel_location = random.choice(cities) if location.upper() == "CHINA" else location
+            location_upper = location.upper()
+            country_key = _COUNTRY_ALIASES.get(location_upper, location_upper)
+            cities = _COUNTRY_CITIES.get(country_key)
+            if cities:
+                hotel_location = random.choice(cities)
             
             # Generate more hotels for better selection
             num_hotels = random.randint(8, 15)  # Generate 8-15 hotel options
-            print(f"🏨 Generating {num_hotels} sample hotels for {hotel_location}")
+            logger.debug("🏨 Generating %d sample hotels for %s", num_hotels, hotel_location)
             
-            # Ensure we don't have duplicate hotel names
-            used_names = set()
+            # Draw the per-hotel random flags and counts in one batch instead of per field
+            breakfast_bits = random.getrandbits(num_hotels)
+            refundable_bits = random.getrandbits(num_hotels)
+            reviews_counts = random.choices(range(50, 2001), k=num_hotels)
+            
+            # Generate price and star columns for every hotel at once based on hotel type
+            (price_low, price_high), (star_low, star_high) = _SAMPLE_TYPE_RANGES.get(hotel_type, _SAMPLE_TYPE_RANGES["hotel"])
+            base_prices = random.choices(range(price_low, price_high + 1), k=num_hotels)
+            star_levels = random.choices(range(star_low, star_high + 1), k=num_hotels)
+            
+            # Apply star rating filter if provided, adjusting price to match the raised star level
+            if min_stars:
+                price_multiplier = 1 + (min_stars - 3) * 0.2
+                for i, star_level in enumerate(star_levels):
+                    if star_level < min_stars:
+                        star_levels[i] = min_stars
+                        base_prices[i] = base_prices[i] * price_multiplier
+            
+            # Apply budget filter if provided
+            if budget_per_night:
+                capped_price = int(budget_per_night * 0.9)
+                base_prices = [capped_price if price > budget_per_night else price for price in base_prices]
+            
+            # Generate rating with more variation but weighted toward good reviews
+            ratings = [
+                round(random.uniform(*_SAMPLE_RATING_RANGES[min(max(star_level, 2), 4)]), 1)
+                for star_level in star_levels
+            ]
+            
+            amenities_column = random.choices(_SAMPLE_AMENITIES_OPTIONS, k=num_hotels)
+            room_type_column = random.choices(_SAMPLE_ROOM_TYPES, k=num_hotels)
+            area_column = random.choices(_SAMPLE_AREAS, k=num_hotels)
+            street_column = random.choices(_SAMPLE_STREETS, k=num_hotels)
+            street_numbers = random.choices(range(1, 1000), k=num_hotels)
+            policy_column = random.choices(_SAMPLE_CANCELLATION_POLICIES, k=num_hotels)
+            distances = [random.uniform(0.2, 8.0) for _ in range(num_hotels)]
+            
+            # Score columns filled in as each hotel is built; _rank_by_value adds the price term
+            amenity_scale = 0.15 / 8
+            static_scores = []
+            prices = []
+            
+            # Ensure we don't have duplicate hotel names by drawing from a pre-shuffled pool
+            shuffled_names = iter(random.sample(_SAMPLE_HOTEL_NAMES, len(_SAMPLE_HOTEL_NAMES)))
             
             for i in range(num_hotels):
                 # Ensure unique hotel names
-                available_names = [name for name in hotel_names if name not in used_names]
-                if not available_names:  # If we've used all names, add a suffix
-                    name = f"{random.choice(hotel_names)} {chr(65 + i)}"
-                else:
-                    name = random.choice(available_names)
-                    used_names.add(name)
-                
-                # Generate price based on hotel type and star rating
-                if hotel_type == "hostel":
-                    base_price = random.randint(800, 2500)
-                    star_level = random.randint(1, 3)
-                elif hotel_type == "resort":
-                    base_price = random.randint(8000, 20000)
-                    star_level = random.randint(3, 5)
-                else:  # hotel
-                    base_price = random.randint(2500, 12000)
-                    star_level = random.randint(2, 5)
+                name = next(shuffled_names, None)
+                if name is None:  # If we've used all names, add a suffix
+                    name = f"{random.choice(_SAMPLE_HOTEL_NAMES)} {chr(65 + i)}"
                 
-                # Apply star rating filter if provided
-                if star_rating and star_level < star_rating:
-                    star_level = star_rating
-                    # Adjust price based on star rating
-                    base_price = base_price * (1 + (star_rating - 3) * 0.2)
-                
-                # Apply budget filter if provided
-                if budget_per_night and base_price > budget_per_night:
-                    base_price = int(budget_per_night * 0.9)
-                
-                # Generate rating with more variation but weighted toward good reviews
-                if star_level >= 4:
-                    rating = round(random.uniform(3.8, 4.9), 1)
-                elif star_level == 3:
-                    rating = round(random.uniform(3.0, 4.5), 1)
-                else:
-                    rating = round(random.uniform(2.5, 4.0), 1)
-                
-                amenities = random.choice(amenities_options)
-                room_type = random.choice(room_types)
+                base_price = float(base_prices[i])
+                star_level = star_levels[i]
+                rating = ratings[i]
+                amenities = amenities_column[i]
+                room_type = room_type_column[i]
+                breakfast_included = bool(breakfast_bits >> i & 1)
+                refundable = bool(refundable_bits >> i & 1)
                 
                 # Generate some image URLs (these would be placeholders for real APIs)
                 images = [
@@ -585,291 +893,145 @@ class HotelSearchTool:
                 ]
                 
                 # Calculate total price based on days and rooms
-                from datetime import date
-                try:
-                    # Handle various date input formats
-                    if isinstance(check_in_date, str):
-                        check_in_dt = datetime.strptime(check_in_date, "%Y-%m-%d")
-                    elif isinstance(check_in_date, datetime):
-                        check_in_dt = check_in_date
-                    elif isinstance(check_in_date, date):
-                        # Convert date to datetime
-                        check_in_dt = datetime.combine(check_in_date, datetime.min.time())
-                    else:
-                        print(f"⚠️ Unexpected check_in_date type: {type(check_in_date)}")
-                        check_in_dt = datetime.now()  # Fallback
-                        
-                    if isinstance(check_out_date, str):
-                        check_out_dt = datetime.strptime(check_out_date, "%Y-%m-%d")
-                    elif isinstance(check_out_date, datetime):
-                        check_out_dt = check_out_date
-                    elif isinstance(check_out_date, date):
-                        # Convert date to datetime
-                        check_out_dt = datetime.combine(check_out_date, datetime.min.time())
-                    else:
-                        print(f"⚠️ Unexpected check_out_date type: {type(check_out_date)}")
-                        # Default to 3 nights if we can't parse checkout date
-                        check_out_dt = check_in_dt + timedelta(days=3)
-                    
-                    nights = max(1, (check_out_dt - check_in_dt).days)  # Ensure at least 1 night
-                    print(f"✅ Calculated {nights} nights stay")
-                except Exception as e:
-                    print(f"⚠️ Date parsing error in hotel option generation: {str(e)}")
-                    nights = 3  # Reasonable default
-                
                 total_price = base_price * nights * rooms
                 
                 # Handle country vs city search by providing appropriate city names for countries
-                location_display = location
-                if location.upper() == "JAPAN":
-                    location_display = random.choice(["Tokyo", "Kyoto", "Osaka", "Hiroshima", "Nara", "Sapporo", "Fukuoka", "Nagoya"])
-                elif location.upper() == "INDIA":
-                    location_display = random.choice(["Mumbai", "Delhi", "Bangalore", "Chennai", "Hyderabad", "Kolkata", "Jaipur", "Goa"])
-                elif location.upper() == "USA" or location.upper() == "UNITED STATES":
-                    location_display = random.choice(["New York", "Los Angeles", "Chicago", "Miami", "Las Vegas", "San Francisco", "Boston", "Seattle"])
-                elif location.upper() == "UK" or location.upper() == "UNITED KINGDOM":
-                    location_display = random.choice(["London", "Manchester", "Edinburgh", "Glasgow", "Liverpool", "Birmingham", "Oxford", "Cambridge"])
+                display_cities = _DISPLAY_CITIES.get(country_key)
+                location_display = random.choice(display_cities) if display_cities else location
                 
-                hotel = {
-                    "id": f"hotel_{i+1}",
-                    "name": f"{name} {location_display}",  # Add city name to hotel name for clarity
-                    "rating": float(rating),  # Ensure float for serialization
-                    "star_level": star_level,
-                    "price_per_night": float(base_price),  # Ensure float for serialization
-                    "currency": "INR",
-                    "total_price": float(total_price),  # Ensure float for serialization
-                    "amenities": amenities,
-                    "room_type": room_type,
-                    "location": f"{location_display} - {random.choice(['City Center', 'Airport Area', 'Tourist District', 'Business District', 'Historic Quarter'])}",
-                    "address": f"{random.randint(1, 999)} {random.choice(['Main St', 'Park Ave', 'Beach Road', 'Market Lane', 'Tourism Road'])}",
-                    "distance_to_center": float(random.uniform(0.2, 8.0)),  # in km
-                    "breakfast_included": random.choice([True, False]),
-                    "refundable": random.choice([True, False]),
-                    "cancellation_policy": random.choice(["Free cancellation", "Non-refundable", "Cancellation with fee", "24-hour cancellation"]),
-                    "images": images,
-                    "availability": "Available",
-                    "reviews_count": random.randint(50, 2000),
-                    "property_type": hotel_type.capitalize()
-                }
+                hotel = Hotel(
+                    id=f"hotel_{i+1}",
+                    name=f"{name} {location_display}",  # Add city name to hotel name for clarity
+                    rating=rating,  # Already a float from round()
+                    star_level=star_level,
+                    price_per_night=base_price,
+                    currency=_INR,
+                    total_price=total_price,  # Float, since base_price is
+                    amenities=amenities,
+                    room_type=room_type,
+                    location=f"{location_display} - {area_column[i]}",
+                    address=f"{street_numbers[i]} {street_column[i]}",
+                    distance_to_center=distances[i],  # in km
+                    breakfast_included=breakfast_included,
+                    refundable=refundable,
+                    cancellation_policy=policy_column[i],
+                    images=images,
+                    availability="Available",
+                    reviews_count=reviews_counts[i],
+                    property_type=property_type
+                )
                 hotels.append(hotel)
+                static_scores.append(_static_value(rating, len(amenities), amenity_scale, breakfast_included, refundable))
+                prices.append(base_price)
             
             # Custom sorting for more realistic "best value" ranking
             # Combine rating, price, and amenities count in a weighted score
-            for hotel in hotels:
-                # Calculate a value score: higher rating and more amenities are better, lower price is better
-                price_factor = 1.0 - (hotel["price_per_night"] / max(h["price_per_night"] for h in hotels))
-                amenities_factor = len(hotel["amenities"]) / 8  # Normalize to 0-1 range assuming max 8 amenities
-                breakfast_factor = 0.1 if hotel["breakfast_included"] else 0
-                
-                # Combined score with weights (rating has most weight, then price, then amenities)
-                hotel["value_score"] = (
-                    (hotel["rating"] / 5) * 0.5 +  # 50% weight to rating (normalized to 0-1)
-                    price_factor * 0.3 +           # 30% weight to price (inversed, lower is better)
-                    amenities_factor * 0.15 +      # 15% weight to amenity count
-                    breakfast_factor +             # 10% bonus for breakfast
-                    (0.05 if hotel["refundable"] else 0)  # 5% bonus for being refundable
-                )
-            
-            # Sort by our computed value score (higher is better)
-            hotels.sort(key=lambda x: -x["value_score"])
-        
-        # Calculate total costs
-        # Calculate nights and ensure all dates are strings for JSON serialization
-        from datetime import date
-        
-        # Handle check-in date
-        if isinstance(check_in_date, str):
-            check_in_date_str = check_in_date
-            try:
-                check_in = datetime.strptime(check_in_date, "%Y-%m-%d")
-            except:
-                check_in = datetime.now()
-        elif isinstance(check_in_date, datetime):
-            check_in = check_in_date
-            check_in_date_str = check_in.strftime("%Y-%m-%d")
-        elif isinstance(check_in_date, date):
-            check_in = datetime.combine(check_in_date, datetime.min.time())
-            check_in_date_str = check_in_date.strftime("%Y-%m-%d")
-        else:
-            print(f"⚠️ Unsupported check_in_date type: {type(check_in_date)}")
-            check_in = datetime.now()
-            check_in_date_str = check_in.strftime("%Y-%m-%d")
-        
-        # Handle check-out date
-        if isinstance(check_out_date, str):
-            check_out_date_str = check_out_date
-            try:
-                check_out = datetime.strptime(check_out_date, "%Y-%m-%d")
-            except:
-                check_out = check_in + timedelta(days=3)
-        elif isinstance(check_out_date, datetime):
-            check_out = check_out_date
-            check_out_date_str = check_out.strftime("%Y-%m-%d")
-        elif isinstance(check_out_date, date):
-            check_out = datetime.combine(check_out_date, datetime.min.time())
-            check_out_date_str = check_out_date.strftime("%Y-%m-%d")
-        else:
-            print(f"⚠️ Unsupported check_out_date type: {type(check_out_date)}")
-            check_out = check_in + timedelta(days=3)
-            check_out_date_str = check_out.strftime("%Y-%m-%d")
-        
-        # Calculate nights
-        try:
-            nights = max(1, (check_out - check_in).days)
-            print(f"✅ Calculated {nights} nights from {check_in_date_str} to {check_out_date_str}")
-        except Exception as e:
-            print(f"⚠️ Error calculating nights: {str(e)}")
-            nights = 3  # Default to 3 nights
+            _rank_by_value(hotels, static_scores, prices)
         
         # Always make sure we have hotels when using sample data
-        if len(hotels) == 0 and api_used in ["sample", "serpapi_fallback", "error_fallback"]:
-            print("⚠️ No sample hotels generated! This is a critical issue, regenerating...")
+        if len(hotels) == 0 and api_used in ["sample", "serpapi_fallback", "serpapi_neg_cache", "error_fallback"]:
+            logger.warning("⚠️ No sample hotels generated! This is a critical issue, regenerating...")
             
             # Map countries to cities for better display
             location_display = location
-            country_cities_map = {
-                "JAPAN": ["Tokyo", "Kyoto", "Osaka", "Hiroshima", "Fukuoka"],
-                "INDIA": ["Mumbai", "Delhi", "Bangalore", "Chennai", "Jaipur"],
-                "USA": ["New York", "Los Angeles", "Chicago", "San Francisco", "Miami"],
-                "UNITED STATES": ["New York", "Los Angeles", "Chicago", "San Francisco", "Miami"],
-                "UK": ["London", "Manchester", "Edinburgh", "Liverpool", "Glasgow"],
-                "UNITED KINGDOM": ["London", "Manchester", "Edinburgh", "Liverpool", "Glasgow"],
-                "GERMANY": ["Berlin", "Munich", "Frankfurt", "Hamburg", "Cologne"],
-                "FRANCE": ["Paris", "Nice", "Lyon", "Marseille", "Bordeaux"],
-                "SPAIN": ["Madrid", "Barcelona", "Seville", "Valencia", "Malaga"],
-                "ITALY": ["Rome", "Milan", "Venice", "Florence", "Naples"],
-                "AUSTRALIA": ["Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide"],
-                "CANADA": ["Toronto", "Vancouver", "Montreal", "Calgary", "Ottawa"],
-                "CHINA": ["Beijing", "Shanghai", "Guangzhou", "Shenzhen", "Xi'an"],
-                "THAILAND": ["Bangkok", "Phuket", "Chiang Mai", "Pattaya", "Krabi"]
-            }
-            
-            # Find appropriate city name for the location
             location_upper = location.upper()
-            if location_upper in country_cities_map:
-                location_display = random.choice(country_cities_map[location_upper])
-                print(f"🌎 Mapped country {location} to city {location_display} for hotel display")
+            if location_upper in _FALLBACK_COUNTRY_CITIES:
+                location_display = random.choice(_FALLBACK_COUNTRY_CITIES[location_upper])
+                logger.debug("🌎 Mapped country %s to city %s for hotel display", location, location_display)
             
-            # Generate realistic hotel names based on location
-            premium_names = ["Grand Hotel", "Royal Palace", "Luxury Suites", "The Ritz", "Four Seasons"]
-            standard_names = ["Comfort Inn", "Best Western", "Holiday Hotel", "City Center Hotel", "Park Plaza"]
-            budget_names = ["Budget Stay", "Economy Lodge", "Traveler's Rest", "Value Inn", "Sleep Well"]
+            # Generate 5-8 hotels as fallback, varying the hotel category per hotel
+            num_hotels = random.randint(5, 8)
+            hotel_type_categories = random.choices(_FALLBACK_CATEGORIES, weights=_FALLBACK_CATEGORY_WEIGHTS, k=num_hotels)
             
-            # Vary the hotel types based on location quality
-            hotel_categories = [premium_names, standard_names, budget_names]
-            weights = [0.3, 0.5, 0.2]  # 30% premium, 50% standard, 20% budget
+            # Pre-draw the per-hotel attributes that don't depend on the category
+            area_column = random.choices(_FALLBACK_AREAS, k=num_hotels)
+            street_column = random.choices(_FALLBACK_STREETS, k=num_hotels)
+            street_numbers = random.choices(range(1, 1000), k=num_hotels)
+            policy_column = random.choices(_FALLBACK_CANCELLATION_POLICIES, k=num_hotels)
+            distances = [random.uniform(0.2, 5.0) for _ in range(num_hotels)]
+            breakfast_bits = random.getrandbits(num_hotels)
+            refundable_bits = random.getrandbits(num_hotels)
+            reviews_counts = random.choices(range(50, 2001), k=num_hotels)
             
-            # Generate 5-8 hotels as fallback
-            num_hotels = random.randint(5, 8)
-            hotel_type_categories = random.choices(hotel_categories, weights=weights, k=num_hotels)
+            # Score columns filled in as each hotel is built; _rank_by_value adds the price term
+            amenity_scale = 0.1 / 6
+            static_scores = []
+            prices = []
             
             for i in range(num_hotels):
-                # Select hotel name from appropriate category
-                hotels_from_category = hotel_type_categories[i]
-                base_name = random.choice(hotels_from_category)
+                # Select hotel name and price/star/rating ranges from the category
+                (category_names, (price_low, price_high), (star_low, star_high),
+                 (rating_low, rating_high), amenity_slices, category_room_types) = hotel_type_categories[i]
+                base_name = random.choice(category_names)
                 
                 # Add location suffix or other distinguishing feature if needed
-                if i > 0 and any(h["name"] == f"{base_name} {location_display}" for h in hotels):
+                if i > 0 and any(h.name == f"{base_name} {location_display}" for h in hotels):
                     name = f"{base_name} {location_display} {chr(65 + i)}"  # Add A, B, C, etc.
                 else:
                     name = f"{base_name} {location_display}"
                 
                 # Set pricing and rating based on category
-                if hotels_from_category == premium_names:
-                    price = random.randint(8000, 25000)
-                    stars = random.randint(4, 5)
-                    rating = round(random.uniform(4.0, 4.9), 1)
-                    amenities = ["WiFi", "Pool", "Spa", "Fine Dining", "Concierge", "Room Service"]
-                    room_type = random.choice(["Deluxe Suite", "Executive Room", "Premium King"])
-                elif hotels_from_category == standard_names:
-                    price = random.randint(4000, 8000)
-                    stars = random.randint(3, 4)
-                    rating = round(random.uniform(3.5, 4.5), 1)
-                    amenities = ["WiFi", "Restaurant", "Fitness Center", "Bar", "Breakfast"]
-                    room_type = random.choice(["Standard Double", "King Room", "Twin Room"])
-                else:  # budget_names
-                    price = random.randint(1500, 4000)
-                    stars = random.randint(2, 3)
-                    rating = round(random.uniform(3.0, 4.0), 1)
-                    amenities = ["WiFi", "24-hour Front Desk", "TV", "Air Conditioning"]
-                    room_type = random.choice(["Standard Room", "Economy Double", "Basic Room"])
+                price = float(random.randint(price_low, price_high))
+                stars = random.randint(star_low, star_high)
+                rating = round(random.uniform(rating_low, rating_high), 1)
+                room_type = random.choice(category_room_types)
+                amenities = random.choice(amenity_slices)  # Randomize amenity count
+                breakfast_included = bool(breakfast_bits >> i & 1)
+                refundable = bool(refundable_bits >> i & 1)
                 
                 # Calculate total price
                 total_price = price * nights
                 
                 # Create the hotel object
-                hotel = {
-                    "id": f"hotel_{i+1}",
-                    "name": name,
-                    "rating": float(rating),
-                    "star_level": stars,
-                    "price_per_night": float(price),
-                    "currency": "INR",
-                    "total_price": float(total_price),
-                    "amenities": amenities[:random.randint(3, len(amenities))],  # Randomize amenity count
-                    "room_type": room_type,
-                    "location": f"{location_display} - {random.choice(['City Center', 'Downtown', 'Tourist District', 'Business District'])}",
-                    "address": f"{random.randint(1, 999)} {random.choice(['Main St', 'Park Avenue', 'Plaza Road', 'Central Blvd'])}",
-                    "distance_to_center": float(random.uniform(0.2, 5.0)),
-                    "breakfast_included": random.choice([True, False]),
-                    "refundable": random.choice([True, False]),
-                    "cancellation_policy": random.choice(["Free cancellation", "Cancellation with fee", "Non-refundable"]),
-                    "images": [
+                hotel = Hotel(
+                    id=f"hotel_{i+1}",
+                    name=name,
+                    rating=rating,
+                    star_level=stars,
+                    price_per_night=price,
+                    currency=_INR,
+                    total_price=total_price,
+                    amenities=amenities,
+                    room_type=room_type,
+                    location=f"{location_display} - {area_column[i]}",
+                    address=f"{street_numbers[i]} {street_column[i]}",
+                    distance_to_center=distances[i],
+                    breakfast_included=breakfast_included,
+                    refundable=refundable,
+                    cancellation_policy=policy_column[i],
+                    images=[
                         f"https://example.com/hotel_{location_display.lower()}_{i+1}_1.jpg",
                         f"https://example.com/hotel_{location_display.lower()}_{i+1}_2.jpg"
                     ],
-                    "availability": "Available",
-                    "reviews_count": random.randint(50, 2000),
-                    "property_type": hotel_type.capitalize()
-                }
+                    availability="Available",
+                    reviews_count=reviews_counts[i],
+                    property_type=property_type
+                )
                 hotels.append(hotel)
+                static_scores.append(_static_value(rating, len(amenities), amenity_scale, breakfast_included, refundable))
+                prices.append(price)
             
             # Sort by rating and price for better display
-            for hotel in hotels:
-                # Calculate a value score: higher rating and more amenities are better, lower price is better
-                price_factor = 1.0 - (hotel["price_per_night"] / max(h["price_per_night"] for h in hotels))
-                amenities_factor = len(hotel["amenities"]) / 6  # Normalize to 0-1 range assuming max 6 amenities
-                breakfast_factor = 0.1 if hotel["breakfast_included"] else 0
-                
-                # Combined score with weights
-                hotel["value_score"] = (
-                    (hotel["rating"] / 5) * 0.5 +  # 50% weight to rating
-                    price_factor * 0.3 +           # 30% weight to price
-                    amenities_factor * 0.1 +       # 10% weight to amenity count
-                    breakfast_factor +             # 10% bonus for breakfast
-                    (0.05 if hotel["refundable"] else 0)  # 5% bonus for being refundable
-                )
-            
-            # Sort by value score (higher is better)
-            hotels.sort(key=lambda x: -x["value_score"])
+            _rank_by_value(hotels, static_scores, prices)
             
-            print(f"✅ Generated {len(hotels)} fallback hotels for {location_display}")
+            logger.debug("✅ Generated %d fallback hotels for %s", len(hotels), location_display)
             
-        # Calculate price ranges for analytics or provide defaults for empty results
         if hotels:
-            price_range = {
-                "min_per_night": float(min(h["price_per_night"] for h in hotels)),
-                "max_per_night": float(max(h["price_per_night"] for h in hotels)),
-                "min_total": float(min(h["total_price"] for h in hotels)),
-                "max_total": float(max(h["total_price"] for h in hotels))
-            }
+            # Calculate price ranges for analytics
+            price_range = _price_range(hotels)
+            
+            # Create formatted text for LLM (not shown to users)
+            formatted_text = self._format_hotels_text(hotels, nights, location, guests, price_range)
         else:
-            # Default price range when no hotels are found
-            price_range = {
-                "min_per_night": 0.0,
-                "max_per_night": 0.0,
-                "min_total": 0.0,
-                "max_total": 0.0
-            }
-        
-        # Create formatted text for LLM (not shown to users)
-        formatted_text = self._format_hotels_text(hotels, nights, location, guests)
+            # Nothing to rank or summarize; skip the reductions and the text cache
+            price_range = _price_range(hotels)
+            formatted_text = self._build_hotels_text((), nights, location, guests, price_range)
         
         # Set up appropriate status and disclaimer based on API used
         status = "live_data" if api_used == "serpapi" else "sample_data"
         if api_used == "serpapi":
             disclaimer = "Live hotel data from Google Hotels via SerpAPI"
-        elif api_used == "serpapi_fallback" or api_used == "error_fallback":
+        elif api_used in ("serpapi_fallback", "serpapi_neg_cache", "error_fallback"):
             disclaimer = "SerpAPI returned no results or encountered an error. Using sample data as fallback."
         else:
             disclaimer = "Sample hotel data for demonstration purposes"
@@ -878,7 +1040,7 @@ class HotelSearchTool:
         result = {
             "formatted": formatted_text,
             "hotels": {
-                "options": hotels,
+                "options": [hotel.to_dict() for hotel in hotels],  # Plain dicts at the JSON boundary
                 "status": status,
                 "disclaimer": disclaimer
             },
@@ -886,57 +1048,80 @@ class HotelSearchTool:
                 "location": location,
                 "check_in_date": check_in_date_str,  # Use string version
                 "check_out_date": check_out_date_str,  # Use string version
-                "guests": int(guests),  # Ensure integers
-                "rooms": int(rooms),  # Ensure integers
-                "nights": int(nights),  # Ensure integers 
-                "budget_max": float(budget_per_night) if budget_per_night else None,
+                "guests": guests,  # Arguments were normalized on entry
+                "rooms": rooms,
+                "nights": nights,
+                "budget_max": budget_per_night,
                 "hotel_type": hotel_type,
-                "star_rating": int(star_rating) if star_rating else None
+                "star_rating": star_rating
             },
             "price_range": price_range,
             "total_options": len(hotels),
-            "best_value": hotels[0]["id"] if hotels else None,
+            "best_value": hotels[0].id if hotels else None,
             "api_used": api_used
         }
         
-        print(f"✅ HotelSearchTool returning {len(hotels)} hotels")
+        logger.info("✅ HotelSearchTool returning %d hotels", len(hotels))
         return result
 
-    def _format_hotels_text(self, hotels: List[Dict[str, Any]], nights: int, location: str, guests: int) -> str:
-        """Format hotel list for display in text form (for LLM consumption)"""
-        formatted = []
-        formatted.append(f"Hotel Search Results for {location}:")
-        formatted.append(f"ACCOMMODATION OPTIONS ({nights} nights, {guests} guests):\n")
+    def _format_hotels_text(self, hotels: List[Hotel], nights: int, location: str, guests: int,
+                            price_range: Optional[Dict[str, float]] = None) -> str:
+        """Format hotel list for display in text form (for LLM consumption), reusing text for repeat results"""
+        # Key on every field the text renders, since hotel ids are positional and repeat across searches;
+        # the same rows then feed the text builder so each field is read once
+        rows = tuple((_TEXT_FIELDS(h), ", ".join(h.amenities[:3])) for h in hotels)
+        cache_key = (rows, nights, location, guests)
+        with self._format_cache_lock:
+            cached = self._format_cache.get(cache_key)
+            if cached is not None:
+                self._format_cache.move_to_end(cache_key)
+                return cached
         
-        for hotel in hotels:
-            amenities_str = ", ".join(hotel["amenities"][:3])  # Show first 3 amenities
-            breakfast = " + Breakfast" if hotel["breakfast_included"] else ""
-            
-            formatted.append(
-                f"• {hotel['name']} ({hotel['rating']}★, {hotel['star_level']}-star): "
-                f"₹{hotel['price_per_night']:,.0f}/night (Total: ₹{hotel['total_price']:,.0f})\n"
-                f"  {hotel['room_type']} | Location: {hotel['location']} ({hotel['distance_to_center']:.1f} km from center)\n"
-                f"  Amenities: {amenities_str}{breakfast}\n"
-                f"  {hotel['cancellation_policy']} | Reviews: {hotel['reviews_count']}\n"
-            )
+        formatted = self._build_hotels_text(rows, nights, location, guests, price_range or _price_range(hotels))
+        with self._format_cache_lock:
+            self._format_cache[cache_key] = formatted
+            if len(self._format_cache) > _FORMAT_CACHE_SIZE:
+                self._format_cache.popitem(last=False)
+        return formatted
+    
+    def _build_hotels_text(self, rows: Sequence[Tuple[Tuple, str]], nights: int, location: str, guests: int,
+                           price_range: Dict[str, float]) -> str:
+        """Build the LLM-facing hotel summary text from (_TEXT_FIELDS values, amenities text) rows"""
+        header = (
+            f"Hotel Search Results for {location}:",
+            f"ACCOMMODATION OPTIONS ({nights} nights, {guests} guests):\n",
+        )
         
-        if hotels:
-            formatted.append(f"\nPRICE RANGE: ₹{min(h['price_per_night'] for h in hotels):,.0f} - ₹{max(h['price_per_night'] for h in hotels):,.0f} per night")
-            formatted.append(f"TOTAL COST RANGE: ₹{min(h['total_price'] for h in hotels):,.0f} - ₹{max(h['total_price'] for h in hotels):,.0f}")
+        hotel_lines = [
+            f"• {name} ({rating}★, {star_level}-star): "
+            f"₹{price_per_night:,.0f}/night (Total: ₹{total_price:,.0f})\n"
+            f"  {room_type} | Location: {hotel_location} ({distance:.1f} km from center)\n"
+            f"  Amenities: {amenities_text}{' + Breakfast' if breakfast_included else ''}\n"
+            f"  {cancellation_policy} | Reviews: {reviews_count}\n"
+            for (name, rating, star_level, price_per_night, total_price, room_type, hotel_location,
+                 distance, breakfast_included, cancellation_policy, reviews_count), amenities_text in rows
+        ]
+        
+        if rows:
+            best_name, best_rating, _, best_price = rows[0][0][:4]
+            summary = (
+                f"\nPRICE RANGE: ₹{price_range['min_per_night']:,.0f} - ₹{price_range['max_per_night']:,.0f} per night",
+                f"TOTAL COST RANGE: ₹{price_range['min_total']:,.0f} - ₹{price_range['max_total']:,.0f}",
+                f"\nBEST VALUE: {best_name} - ₹{best_price:,.0f}/night (Rating: {best_rating})",
+            )
         else:
-            formatted.append("\nNo hotel options found matching your criteria.")
+            summary = ("\nNo hotel options found matching your criteria.",)
         
-        if hotels:
-            formatted.append(f"\nBEST VALUE: {hotels[0]['name']} - ₹{hotels[0]['price_per_night']:,.0f}/night (Rating: {hotels[0]['rating']})")
-            
-        formatted.append(f"\nRECOMMENDATIONS:")
-        formatted.append(f"• Book early for better rates")
-        formatted.append(f"• Check cancellation policies")
-        formatted.append(f"• Consider location vs price trade-offs")
-        if hotels:
-            formatted.append(f"• {hotels[0]['name']} offers best value for money")
+        recommendations = (
+            "\nRECOMMENDATIONS:",
+            "• Book early for better rates",
+            "• Check cancellation policies",
+            "• Consider location vs price trade-offs",
+        )
+        if rows:
+            recommendations += (f"• {best_name} offers best value for money",)
         
-        return "\n".join(formatted)
+        return "\n".join(chain(header, hotel_lines, summary, recommendations))
 
     async def _arun(
         self,
@@ -951,8 +1136,9 @@ class HotelSearchTool:
         use_real_api: bool = True,
         **kwargs: Any,
     ) -> Dict[str, Any]:
-        """Async version of the hotel search"""
-        return self._run(
+        """Async version of the hotel search, run in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(
+            self._run,
             location=location, 
             check_in_date=check_in_date, 
             check_out_date=check_out_date, 
@@ -964,3 +1150,31 @@ class HotelSearchTool:
             use_real_api=use_real_api,
             **kwargs
         )
+    
+    async def batch_search(self, queries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run several hotel searches (e.g. one per city of an itinerary) concurrently, results in query order"""
+        # Identical queries are searched once and share the result
+        unique: Dict[Tuple, Dict[str, Any]] = {}
+        keys = []
+        for query in queries:
+            key = _batch_key(query)
+            unique.setdefault(key, query)
+            keys.append(key)
+        
+        semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+        
+        async def search(query: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._arun(**query)
+        
+        results = await asyncio.gather(*(search(query) for query in unique.values()))
+        by_key = dict(zip(unique, results))
+        logger.debug("🏨 Batch hotel search: %d queries, %d unique", len(queries), len(unique))
+        
+        # Repeats get their own copy so editing one position never changes another
+        ordered = []
+        seen = set()
+        for key in keys:
+            ordered.append(copy.deepcopy(by_key[key]) if key in seen else by_key[key])
+            seen.add(key)
+        return ordered
@@ -1,7 +1,65 @@
 from langchain.tools import BaseTool
-from typing import Optional, Type, Dict, Any, List
+from typing import Optional, Type, Dict, Any, List, Tuple
 from pydantic import BaseModel, Field
+import asyncio
 import random
+import threading
+from types import MappingProxyType
+from cachetools import LRUCache
+
+# Mock restaurant data - replace with real API calls
+_RESTAURANT_ENTRIES = {
+    "local": (
+        {"name": "Traditional Spice Kitchen", "cuisine": "Local Traditional", "price_range": "₹₹"},
+        {"name": "Heritage Restaurant", "cuisine": "Regional Specialties", "price_range": "₹₹₹"},
+        {"name": "Street Food Corner", "cuisine": "Local Street Food", "price_range": "₹"},
+        {"name": "Authentic Local Diner", "cuisine": "Home-style Cooking", "price_range": "₹₹"}
+    ),
+    "international": (
+        {"name": "Italian Bistro", "cuisine": "Italian", "price_range": "₹₹₹"},
+        {"name": "Asian Fusion", "cuisine": "Pan-Asian", "price_range": "₹₹₹"},
+        {"name": "Mediterranean Grill", "cuisine": "Mediterranean", "price_range": "₹₹"},
+        {"name": "Continental Cafe", "cuisine": "Continental", "price_range": "₹₹"}
+    ),
+    "vegetarian": (
+        {"name": "Pure Veg Paradise", "cuisine": "Vegetarian", "price_range": "₹₹"},
+        {"name": "Green Garden Restaurant", "cuisine": "Vegan & Vegetarian", "price_range": "₹₹"},
+        {"name": "Satvik Dining", "cuisine": "Traditional Vegetarian", "price_range": "₹"},
+        {"name": "Organic Farm Kitchen", "cuisine": "Organic Vegetarian", "price_range": "₹₹₹"}
+    )
+}
+
+# Read-only views, so a request can never write its per-search fields back into the catalog
+_RESTAURANTS_DB = {
+    category: tuple(MappingProxyType(r) for r in restaurants)
+    for category, restaurants in _RESTAURANT_ENTRIES.items()
+}
+
+# Every catalog entry, flattened once so extra picks don't rebuild it per search
+_ALL_RESTAURANTS = tuple(r for restaurants in _RESTAURANTS_DB.values() for r in restaurants)
+
+_BASE_PRICES = {"₹": 300, "₹₹": 800, "₹₹₹": 1500}
+_MEAL_MULTIPLIERS = {"breakfast": 0.6, "lunch": 0.8, "dinner": 1.0, "snacks": 0.4}
+
+_SPECIALTIES_MAP = {
+    "Local Traditional": ("Curry", "Rice Dishes", "Traditional Bread"),
+    "Regional Specialties": ("Regional Curry", "Local Sweets", "Signature Dishes"),
+    "Local Street Food": ("Chaat", "Kebabs", "Local Snacks"),
+    "Italian": ("Pasta", "Pizza", "Risotto"),
+    "Pan-Asian": ("Noodles", "Stir-fry", "Sushi"),
+    "Mediterranean": ("Grilled Items", "Salads", "Seafood"),
+    "Vegetarian": ("Dal", "Vegetable Curry", "Paneer Dishes")
+}
+_DEFAULT_SPECIALTIES = ("Special Dishes", "Chef's Recommendations")
+
+_AREAS = ("City Center", "Food Street", "Mall Area", "Old Town")
+_AMBIANCES = ("Casual", "Fine Dining", "Family-friendly", "Romantic", "Traditional")
+_SERVICES = ("Table Service", "Quick Service", "Buffet", "Self Service")
+
+# Results are generated from an RNG seeded by the search arguments, so repeat calls can be
+# served from this cache and still match what a fresh generation would produce
+_RESULTS_CACHE = LRUCache(maxsize=256)
+_RESULTS_CACHE_LOCK = threading.Lock()
 
 class RestaurantSearchInput(BaseModel):
     """Input for restaurant search tool"""
@@ -28,69 +86,60 @@ class RestaurantSearchTool(BaseTool):
         **kwargs: Any,
     ) -> str:
         """Execute the restaurant search"""
-        
-        # Mock restaurant data - replace with real API calls
-        restaurants_db = {
-            "local": [
-                {"name": "Traditional Spice Kitchen", "cuisine": "Local Traditional", "price_range": "₹₹"},
-                {"name": "Heritage Restaurant", "cuisine": "Regional Specialties", "price_range": "₹₹₹"},
-                {"name": "Street Food Corner", "cuisine": "Local Street Food", "price_range": "₹"},
-                {"name": "Authentic Local Diner", "cuisine": "Home-style Cooking", "price_range": "₹₹"}
-            ],
-            "international": [
-                {"name": "Italian Bistro", "cuisine": "Italian", "price_range": "₹₹₹"},
-                {"name": "Asian Fusion", "cuisine": "Pan-Asian", "price_range": "₹₹₹"},
-                {"name": "Mediterranean Grill", "cuisine": "Mediterranean", "price_range": "₹₹"},
-                {"name": "Continental Cafe", "cuisine": "Continental", "price_range": "₹₹"}
-            ],
-            "vegetarian": [
-                {"name": "Pure Veg Paradise", "cuisine": "Vegetarian", "price_range": "₹₹"},
-                {"name": "Green Garden Restaurant", "cuisine": "Vegan & Vegetarian", "price_range": "₹₹"},
-                {"name": "Satvik Dining", "cuisine": "Traditional Vegetarian", "price_range": "₹"},
-                {"name": "Organic Farm Kitchen", "cuisine": "Organic Vegetarian", "price_range": "₹₹₹"}
-            ]
-        }
+        cache_key = (location, cuisine_type, budget_per_meal, meal_type)
+        with _RESULTS_CACHE_LOCK:
+            results = _RESULTS_CACHE.get(cache_key)
+        if results is None:
+            rng = random.Random("|".join(map(str, cache_key)))
+            results = self._build_results(location, cuisine_type, budget_per_meal, meal_type, rng)
+            with _RESULTS_CACHE_LOCK:
+                _RESULTS_CACHE[cache_key] = results
+        return results
+    
+    def _build_results(self, location: str, cuisine_type: str, budget_per_meal: Optional[float],
+                       meal_type: str, rng: random.Random) -> str:
+        """Generate the restaurant results text, drawing all randomness from rng"""
         
         # Get restaurants based on cuisine type
         cuisine_lower = cuisine_type.lower()
-        if cuisine_lower in restaurants_db:
-            selected_restaurants = restaurants_db[cuisine_lower].copy()
-        else:
-            selected_restaurants = restaurants_db["local"].copy()
+        templates = _RESTAURANTS_DB.get(cuisine_lower, _RESTAURANTS_DB["local"])
         
-        # Add random additional restaurants from other categories
-        all_restaurants = []
-        for restaurants in restaurants_db.values():
-            all_restaurants.extend(restaurants)
+        # Add 2 more random restaurants from other categories
+        selected_ids = {id(r) for r in templates}
+        additional = rng.sample([r for r in _ALL_RESTAURANTS if id(r) not in selected_ids], 2)
+        picked = templates + tuple(additional)
         
-        # Add 2 more random restaurants
-        additional = random.sample([r for r in all_restaurants if r not in selected_restaurants], 2)
-        selected_restaurants.extend(additional)
+        # Draw the random per-restaurant fields for the whole list in one batch
+        count = len(picked)
+        area_column = rng.choices(_AREAS, k=count)
+        ambiance_column = rng.choices(_AMBIANCES, k=count)
+        service_column = rng.choices(_SERVICES, k=count)
+        reservation_bits = rng.getrandbits(count)
         
-        # Add detailed information
-        for restaurant in selected_restaurants:
+        # Build each result from its catalog template plus the per-request details
+        selected_restaurants = []
+        for i, template in enumerate(picked):
             # Determine price based on price range and meal type
-            base_prices = {"₹": 300, "₹₹": 800, "₹₹₹": 1500}
-            base_price = base_prices[restaurant["price_range"]]
+            base_price = _BASE_PRICES[template["price_range"]]
             
             # Adjust for meal type
-            meal_multipliers = {"breakfast": 0.6, "lunch": 0.8, "dinner": 1.0, "snacks": 0.4}
-            actual_price = int(base_price * meal_multipliers.get(meal_type, 1.0))
+            actual_price = int(base_price * _MEAL_MULTIPLIERS.get(meal_type, 1.0))
             
             # Apply budget filter if provided
             if budget_per_meal and actual_price > budget_per_meal:
                 actual_price = int(budget_per_meal * 0.9)
             
-            restaurant.update({
+            selected_restaurants.append({
+                **template,
                 "average_price": actual_price,
-                "rating": round(random.uniform(3.5, 4.8), 1),
-                "location": f"{location} - {random.choice(['City Center', 'Food Street', 'Mall Area', 'Old Town'])}",
-                "specialties": self._get_specialties(restaurant["cuisine"]),
-                "ambiance": random.choice(["Casual", "Fine Dining", "Family-friendly", "Romantic", "Traditional"]),
-                "service": random.choice(["Table Service", "Quick Service", "Buffet", "Self Service"]),
-                "distance": f"{random.uniform(0.5, 3.0):.1f} km from center",
+                "rating": round(rng.uniform(3.5, 4.8), 1),
+                "location": f"{location} - {area_column[i]}",
+                "specialties": self._get_specialties(template["cuisine"]),
+                "ambiance": ambiance_column[i],
+                "service": service_column[i],
+                "distance": f"{rng.uniform(0.5, 3.0):.1f} km from center",
                 "opening_hours": "11:00 AM - 11:00 PM",
-                "reservation_required": random.choice([True, False])
+                "reservation_required": bool(reservation_bits >> i & 1)
             })
         
         # Sort by rating and price
@@ -113,18 +162,9 @@ DINING TIPS:
 • Consider location when planning your itinerary
 """
 
-    def _get_specialties(self, cuisine: str) -> List[str]:
+    def _get_specialties(self, cuisine: str) -> Tuple[str, ...]:
         """Get typical specialties for a cuisine type"""
-        specialties_map = {
-            "Local Traditional": ["Curry", "Rice Dishes", "Traditional Bread"],
-            "Regional Specialties": ["Regional Curry", "Local Sweets", "Signature Dishes"],
-            "Local Street Food": ["Chaat", "Kebabs", "Local Snacks"],
-            "Italian": ["Pasta", "Pizza", "Risotto"],
-            "Pan-Asian": ["Noodles", "Stir-fry", "Sushi"],
-            "Mediterranean": ["Grilled Items", "Salads", "Seafood"],
-            "Vegetarian": ["Dal", "Vegetable Curry", "Paneer Dishes"]
-        }
-        return specialties_map.get(cuisine, ["Special Dishes", "Chef's Recommendations"])
+        return _SPECIALTIES_MAP.get(cuisine, _DEFAULT_SPECIALTIES)
 
     def _format_restaurants(self, restaurants: List[Dict[str, Any]]) -> str:
         """Format restaurant list for display"""
@@ -160,5 +200,5 @@ DINING TIPS:
         meal_type: str = "dinner",
         **kwargs: Any,
     ) -> str:
-        """Async version of the restaurant search"""
-        return self._run(location, cuisine_type, budget_per_meal, meal_type, **kwargs)
+        """Async version of the restaurant search, run in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(self._run, location, cuisine_type, budget_per_meal, meal_type, **kwargs)
@@ -1,8 +1,21 @@
 from langchain.tools import BaseTool
 from typing import Optional, Type, Dict, Any
 from pydantic import BaseModel, Field
+import asyncio
 import random
+import re
+import threading
 from datetime import datetime, timedelta
+from cachetools import LRUCache
+
+# Destinations matched anywhere in the location (case-insensitive) to pick a climate profile
+_TROPICAL_RE = re.compile(r"goa|kerala|mumbai|chennai", re.IGNORECASE)
+_COLD_RE = re.compile(r"kashmir|himachal|uttarakhand|ladakh", re.IGNORECASE)
+
+# Reports are generated from an RNG seeded by (location, start date), so repeat calls can be
+# served from this cache and still match what a fresh generation would produce
+_REPORT_CACHE = LRUCache(maxsize=256)
+_REPORT_CACHE_LOCK = threading.Lock()
 
 class WeatherInfoInput(BaseModel):
     """Input for weather information tool"""
@@ -25,6 +38,30 @@ class WeatherInfoTool(BaseTool):
         **kwargs: Any,
     ) -> str:
         """Execute the weather information lookup"""
+        # Resolve the forecast start date; without one the forecast starts today
+        if date:
+            try:
+                start_date = datetime.fromisoformat(date)
+            except (TypeError, ValueError):
+                try:
+                    start_date = datetime.strptime(date, "%Y-%m-%d")
+                except (TypeError, ValueError):
+                    start_date = datetime.now()
+        else:
+            start_date = datetime.now()
+        start_date = datetime(start_date.year, start_date.month, start_date.day)
+        
+        cache_key = (location, start_date.date().isoformat())
+        with _REPORT_CACHE_LOCK:
+            report = _REPORT_CACHE.get(cache_key)
+        if report is None:
+            report = self._build_report(location, start_date, random.Random("|".join(cache_key)))
+            with _REPORT_CACHE_LOCK:
+                _REPORT_CACHE[cache_key] = report
+        return report
+    
+    def _build_report(self, location: str, start_date: datetime, rng: random.Random) -> str:
+        """Generate the weather report text, drawing all randomness from rng"""
         
         # Mock weather data - replace with real weather API calls
         weather_conditions = [
@@ -33,12 +70,12 @@ class WeatherInfoTool(BaseTool):
         ]
         
         # Generate realistic weather based on location (simplified)
-        if any(tropical in location.lower() for tropical in ["goa", "kerala", "mumbai", "chennai"]):
+        if _TROPICAL_RE.search(location):
             # Tropical climate
             temp_range = (25, 35)
             humidity_range = (60, 85)
             likely_conditions = ["Sunny", "Partly Cloudy", "Light Rain", "Thunderstorms"]
-        elif any(cold in location.lower() for cold in ["kashmir", "himachal", "uttarakhand", "ladakh"]):
+        elif _COLD_RE.search(location):
             # Cold climate
             temp_range = (5, 20)
             humidity_range = (40, 70)
@@ -51,33 +88,32 @@ class WeatherInfoTool(BaseTool):
         
         # Generate weather data
         current_weather = {
-            "temperature": random.randint(*temp_range),
-            "condition": random.choice(likely_conditions),
-            "humidity": random.randint(*humidity_range),
-            "wind_speed": random.randint(5, 25),
-            "visibility": random.choice(["Excellent", "Good", "Fair", "Poor"]),
-            "uv_index": random.randint(3, 10)
+            "temperature": rng.randint(*temp_range),
+            "condition": rng.choice(likely_conditions),
+            "humidity": rng.randint(*humidity_range),
+            "wind_speed": rng.randint(5, 25),
+            "visibility": rng.choice(["Excellent", "Good", "Fair", "Poor"]),
+            "uv_index": rng.randint(3, 10)
         }
         
-        # Generate 5-day forecast if date is provided
+        # Generate 5-day forecast from the start date
         forecast = []
-        if date:
-            try:
-                start_date = datetime.strptime(date, "%Y-%m-%d")
-            except:
-                start_date = datetime.now()
-        else:
-            start_date = datetime.now()
+        
+        # Draw each forecast column for all 5 days at once
+        highs = rng.choices(range(temp_range[0] + 2, temp_range[1] + 6), k=5)
+        lows = rng.choices(range(temp_range[0] - 2, temp_range[1] - 4), k=5)
+        conditions = rng.choices(likely_conditions, k=5)
+        rain_chances = rng.choices(range(0, 81), k=5)
         
         for i in range(5):
             forecast_date = start_date + timedelta(days=i)
             day_weather = {
                 "date": forecast_date.strftime("%Y-%m-%d"),
                 "day": forecast_date.strftime("%A"),
-                "high": random.randint(temp_range[0] + 2, temp_range[1] + 5),
-                "low": random.randint(temp_range[0] - 2, temp_range[1] - 5),
-                "condition": random.choice(likely_conditions),
-                "rain_chance": random.randint(0, 80)
+                "high": highs[i],
+                "low": lows[i],
+                "condition": conditions[i],
+                "rain_chance": rain_chances[i]
             }
             forecast.append(day_weather)
         
@@ -154,15 +190,23 @@ WHAT TO PACK:
         """Generate packing suggestions based on weather"""
         suggestions = []
         
-        # Temperature-based packing
-        max_temp = max([day['high'] for day in forecast])
-        min_temp = min([day['low'] for day in forecast])
+        # Temperature and rain extremes, gathered in one pass over the forecast
+        max_temp = float("-inf")
+        min_temp = float("inf")
+        wet = False
+        for day in forecast:
+            if day['high'] > max_temp:
+                max_temp = day['high']
+            if day['low'] < min_temp:
+                min_temp = day['low']
+            if day['rain_chance'] > 50:
+                wet = True
         
         if max_temp > 30:
             suggestions.extend(["Light cotton clothes", "Sunglasses", "Hat/cap"])
         if min_temp < 15:
             suggestions.extend(["Warm jacket", "Long pants", "Closed shoes"])
-        if any(day['rain_chance'] > 50 for day in forecast):
+        if wet:
             suggestions.extend(["Umbrella", "Raincoat", "Waterproof shoes"])
         
         # General items
@@ -176,5 +220,5 @@ WHAT TO PACK:
         date: Optional[str] = None,
         **kwargs: Any,
     ) -> str:
-        """Async version of the weather information lookup"""
-        return self._run(location, date, **kwargs)
+        """Async version of the weather information lookup, run in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(self._run, location, date, **kwargs)
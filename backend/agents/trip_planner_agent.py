@@ -1,10 +1,17 @@
 from langchain_google_genai import ChatGoogleGenerativeAI
-from typing import Dict, Any, List
+from google.api_core import exceptions as google_exceptions
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 import asyncio
-import json
+import functools
+from datetime import date, datetime, timedelta
+import hashlib
+import logging
 import os
-import re
 import random
+from collections import deque
+from operator import itemgetter
+import orjson
+from cachetools import TTLCache
 
 from models.trip_request import TripRequest
 from agents.tools.flight_search import FlightSearchTool
@@ -14,42 +21,52 @@ from agents.tools.restaurant_search import RestaurantSearchTool
 from agents.tools.weather_info import WeatherInfoTool
 from agents.tools.currency_converter import CurrencyConverterTool
 from utils.logger import setup_logger
+from utils.circuit_breaker import CircuitBreaker
 
 logger = setup_logger()
 
-class TripPlannerAgent:
-    """
-    Main trip planning agent using Google Gemini
-    
-    This agent coordinates the entire trip planning process:
-    1. Goal interpretation
-    2. Task breakdown
-    3. Tool execution
-    4. Itinerary generation    """
-    
-    def __init__(self):
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-flash",
-            temperature=0.1,
-            google_api_key=os.getenv("GOOGLE_API_KEY")
-        )
-        
-        # Initialize tools
-        self.tools = {
-            "flight_search": FlightSearchTool(),
-            "hotel_search": HotelSearchTool(),
-            "attraction_search": AttractionSearchTool(),
-            "restaurant_search": RestaurantSearchTool(),
-            "weather_info": WeatherInfoTool(),
-            "currency_converter": CurrencyConverterTool()
-        }
-        
-        # Conversation history
-        self.conversation_history = []
-    
-    def _create_system_prompt(self) -> str:
-        """Create the system prompt for the agent"""
-        return """You are an expert AI trip planner agent. Your role is to create comprehensive, personalized travel itineraries.
+# Itineraries embed live prices, so cached Gemini responses expire; GEMINI_CACHE_TTL=0 disables caching
+_RESPONSE_CACHE_TTL = int(os.getenv("GEMINI_CACHE_TTL", "3600"))
+_RESPONSE_CACHE_SIZE = 2048
+_CONVERSATION_HISTORY_SIZE = 32
+
+# Retry transient Gemini failures with jittered exponential backoff; sustained
+# failures open the breaker so requests go straight to the fallback itinerary
+_GEMINI_MAX_ATTEMPTS = 3
+_GEMINI_RETRY_BASE_DELAY = 0.5
+_GEMINI_RETRY_MAX_DELAY = 4.0
+_GEMINI_TRANSIENT_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded,
+    asyncio.TimeoutError,
+)
+_gemini_breaker = CircuitBreaker(fail_max=5, reset_timeout=30.0)
+
+# Common airport mappings for fallback itineraries
+_AIRPORT_CODES = {
+    # India
+    'delhi': 'DEL', 'new delhi': 'DEL',
+    'mumbai': 'BOM', 'bombay': 'BOM',
+    'bangalore': 'BLR', 'bengaluru': 'BLR',
+    'chennai': 'MAA', 'madras': 'MAA',
+    'hyderabad': 'HYD',
+    'kolkata': 'CCU', 'calcutta': 'CCU',
+    'goa': 'GOI',
+
+    # International
+    'tokyo': 'NRT', 'japan': 'NRT',
+    'london': 'LHR', 'uk': 'LHR',
+    'paris': 'CDG', 'france': 'CDG',
+    'new york': 'JFK', 'nyc': 'JFK',
+    'dubai': 'DXB', 'uae': 'DXB',
+    'singapore': 'SIN',
+    'bangkok': 'BKK', 'thailand': 'BKK',
+    'sydney': 'SYD', 'australia': 'SYD'
+}
+
+_SYSTEM_PROMPT = """You are an expert AI trip planner agent. Your role is to create comprehensive, personalized travel itineraries.
 
 ## Your Process:
 1. **Goal Interpretation**: Understand the user's travel goals, budget, and preferences
@@ -90,6 +107,199 @@ Generate a structured JSON itinerary with:
 
 Remember: You're an autonomous agent - make decisions confidently based on the available information and tools."""
 
+
+# Itinerary instructions appended to the planning brief; filled in with str.format
+_FINAL_PROMPT_TEMPLATE = """
+The tools have already been run for this trip. Do not issue any TOOL_CALL requests;
+based on the following tool results, create a detailed JSON itinerary:
+
+{tool_results_json}
+
+Create a comprehensive itinerary in JSON format with the structure:
+{{
+    "destination": "{destination}",
+    "total_days": {total_days},
+    "total_cost": <calculated_total>,
+    "currency": "INR",
+    "daily_itinerary": [
+        {{
+            "day": 1,
+            "date": "Day 1",
+            "activities": [...],
+            "meals": [...],
+            "accommodation": {{}},
+            "estimated_cost": <cost>
+        }}
+    ],
+    "flights": {{}},
+    "accommodation_summary": {{}},
+    "cost_breakdown": {{}},
+    "recommendations": []
+}}
+
+Make sure all costs fit within the budget of {budget}.
+Respond with the JSON object only, without markdown fences or commentary.
+"""
+
+
+def _format_inr(amount: float) -> str:
+    """Format an amount as whole rupees with thousands separators, e.g. ₹150,000"""
+    return f"₹{amount:,.0f}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_planning_prompt(destination: str, budget: float, travelers: int, duration_days: int,
+                           start_date: Any, interests: Tuple[str, ...], accommodation_type: str,
+                           transport_mode: str, special_requirements: str) -> str:
+    """Render the planning prompt; identical requests share one cached string"""
+    interests_str = ", ".join(interests) if interests else "general sightseeing"
+    budget_str = _format_inr(budget)
+    
+    return f"""
+Plan a comprehensive {duration_days}-day trip to {destination} with the following requirements:
+
+**Budget**: {budget_str} INR total
+**Travelers**: {travelers} person(s)
+**Duration**: {duration_days} days
+**Start Date**: {start_date or 'Flexible'}
+**Interests**: {interests_str}
+**Accommodation Type**: {accommodation_type}
+**Transport Mode**: {transport_mode}
+**Special Requirements**: {special_requirements or 'None'}
+
+Please follow this process step by step:
+
+1. First, search for flights to {destination} within budget
+2. Then, find accommodation options that fit the budget and preferences  
+3. Research attractions based on interests: {interests_str}
+4. Find restaurants for dining experiences
+5. Check weather for appropriate planning
+6. Calculate costs and ensure everything fits within {budget_str}
+
+Create a detailed day-by-day itinerary with:
+- Specific timings for each activity
+- Transportation between locations
+- Meal recommendations
+- Cost breakdown for each day
+- Alternative options if something is unavailable
+
+Make sure the total cost does not exceed the budget of {budget_str}.
+
+Start by using the tools to gather information, then create the final itinerary.
+"""
+
+
+def _trip_dates(start: Any, duration_days: int) -> Tuple[str, str]:
+    """Resolve the trip's ISO start and checkout dates, starting today when no valid start is given"""
+    if isinstance(start, datetime):
+        start = start.date()
+    elif not isinstance(start, date):
+        try:
+            start = date.fromisoformat(start)
+        except (TypeError, ValueError):
+            start = date.today()
+    try:
+        end = start + timedelta(days=duration_days)
+    except (TypeError, OverflowError):
+        end = start + timedelta(days=3)
+    return start.isoformat(), end.isoformat()
+
+
+def _extract_json_span(text: str) -> Optional[str]:
+    """Return the first balanced {...} object in text, scanning it once"""
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def _parse_itinerary_json(text: str) -> Optional[Dict[str, Any]]:
+    """Parse the itinerary object from a Gemini response, scanning for it only when the reply isn't bare JSON"""
+    try:
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        json_str = _extract_json_span(text)
+        if not json_str:
+            return None
+        data = orjson.loads(json_str)
+    return data if isinstance(data, dict) else None
+
+
+class TripPlannerAgent:
+    """
+    Main trip planning agent using Google Gemini
+    
+    This agent coordinates the entire trip planning process:
+    1. Goal interpretation
+    2. Task breakdown
+    3. Tool execution
+    4. Itinerary generation    """
+    
+    # Shared by every agent so the Gemini client's connection pool and the
+    # tools' HTTP sessions and caches outlive a single instance
+    _llm_instance = None
+    _tools_instance = None
+    
+    @classmethod
+    def _get_llm(cls) -> ChatGoogleGenerativeAI:
+        if cls._llm_instance is None:
+            cls._llm_instance = ChatGoogleGenerativeAI(
+                model="gemini-1.5-flash",
+                temperature=0.1,
+                google_api_key=os.getenv("GOOGLE_API_KEY")
+            )
+        return cls._llm_instance
+    
+    @classmethod
+    def _get_tools(cls) -> Dict[str, Any]:
+        if cls._tools_instance is None:
+            cls._tools_instance = {
+                "flight_search": FlightSearchTool(),
+                "hotel_search": HotelSearchTool(),
+                "attraction_search": AttractionSearchTool(),
+                "restaurant_search": RestaurantSearchTool(),
+                "weather_info": WeatherInfoTool(),
+                "currency_converter": CurrencyConverterTool()
+            }
+        return cls._tools_instance
+    
+    def __init__(self):
+        self.llm = type(self)._get_llm()
+        
+        # Initialize tools
+        self.tools = type(self)._get_tools()
+        
+        # Conversation history, bounded since one agent serves every session
+        self.conversation_history = deque(maxlen=_CONVERSATION_HISTORY_SIZE)
+        
+        # Gemini responses keyed by prompt digest, and the calls currently in
+        # flight under the same keys; only touched from the event loop
+        self._response_cache = TTLCache(maxsize=_RESPONSE_CACHE_SIZE, ttl=_RESPONSE_CACHE_TTL)
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+    
+    def _create_system_prompt(self) -> str:
+        """Create the system prompt for the agent"""
+        return _SYSTEM_PROMPT
+
     async def plan_trip(self, session_id: str, request: TripRequest) -> Dict[str, Any]:
         """
         Main method to plan a trip using the agent
@@ -120,232 +330,229 @@ Remember: You're an autonomous agent - make decisions confidently based on the a
             logger.error(f"Error in trip planning: {str(e)}")
             raise
 
-    def _create_planning_prompt(self, request: TripRequest) -> str:
-        """Create a detailed planning prompt from the request"""
-        interests_str = ", ".join(request.interests) if request.interests else "general sightseeing"
+    async def plan_trip_stream(self, session_id: str, request: TripRequest) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Plan a trip like plan_trip, streaming the itinerary text as Gemini generates it
         
-        prompt = f"""
-Plan a comprehensive {request.duration_days}-day trip to {request.destination} with the following requirements:
-
-**Budget**: ₹{request.budget:,.0f} INR total
-**Travelers**: {request.travelers} person(s)
-**Duration**: {request.duration_days} days
-**Start Date**: {request.start_date or 'Flexible'}
-**Interests**: {interests_str}
-**Accommodation Type**: {request.accommodation_type}
-**Transport Mode**: {request.transport_mode}
-**Special Requirements**: {request.special_requirements or 'None'}
-
-Please follow this process step by step:
-
-1. First, search for flights to {request.destination} within budget
-2. Then, find accommodation options that fit the budget and preferences  
-3. Research attractions based on interests: {interests_str}
-4. Find restaurants for dining experiences
-5. Check weather for appropriate planning
-6. Calculate costs and ensure everything fits within ₹{request.budget:,.0f}
-
-Create a detailed day-by-day itinerary with:
-- Specific timings for each activity
-- Transportation between locations
-- Meal recommendations
-- Cost breakdown for each day
-- Alternative options if something is unavailable
-
-Make sure the total cost does not exceed the budget of ₹{request.budget:,.0f}.
-
-Start by using the tools to gather information, then create the final itinerary.
-"""
-        return prompt
-
-    async def _execute_planning_process(self, prompt: str, request: TripRequest) -> Dict[str, Any]:
-        """Execute the planning process step by step"""
+        Args:
+            session_id: Unique session identifier
+            request: Trip planning request
+            
+        Yields:
+            {"type": "token", "content": str} events while the itinerary is generated,
+            then a single {"type": "itinerary", "itinerary": dict} event
+        """
+        logger.info(f"Starting streamed trip planning for session {session_id}")
         
-        # Start with the system prompt and user request
-        full_prompt = self._create_system_prompt() + "\n\n" + prompt
+        planning_prompt = self._create_planning_prompt(request)
+        tool_results = await self._execute_tool_calls(request)
+        final_prompt = self._create_final_prompt(planning_prompt, request, tool_results)
         
-        # Step 1: Get initial plan from Gemini
-        response = await self._call_gemini(full_prompt)
+        chunks = []
+        async for chunk in self._stream_gemini(final_prompt):
+            chunks.append(chunk)
+            yield {"type": "token", "content": chunk}
         
-        # Step 2: Execute any tool calls found in the response
-        tool_results = await self._execute_tool_calls(response, request)
+        # The JSON can only be parsed once the whole response is in
+        result = {"tool_results": tool_results, "final_itinerary": "".join(chunks)}
+        itinerary = self._structure_itinerary(result, request)
         
-        # Step 3: Get final itinerary with tool results
-        final_prompt = f"""
-Based on the following tool results, create a detailed JSON itinerary:
-
-{json.dumps(tool_results, indent=2)}
+        logger.info(f"Trip planning completed for session {session_id}")
+        yield {"type": "itinerary", "itinerary": itinerary}
 
-Create a comprehensive itinerary in JSON format with the structure:
-{{
-    "destination": "{request.destination}",
-    "total_days": {request.duration_days},
-    "total_cost": <calculated_total>,
-    "currency": "INR",
-    "daily_itinerary": [
-        {{
-            "day": 1,
-            "date": "Day 1",
-            "activities": [...],
-            "meals": [...],
-            "accommodation": {{}},
-            "estimated_cost": <cost>
-        }}
-    ],
-    "flights": {{}},
-    "accommodation_summary": {{}},
-    "cost_breakdown": {{}},
-    "recommendations": []
-}}
+    def _create_planning_prompt(self, request: TripRequest) -> str:
+        """Create a detailed planning prompt from the request"""
+        return _build_planning_prompt(
+            request.destination,
+            request.budget,
+            request.travelers,
+            request.duration_days,
+            request.start_date,
+            tuple(request.interests or ()),
+            request.accommodation_type,
+            request.transport_mode,
+            request.special_requirements
+        )
 
-Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
-"""
+    async def _execute_planning_process(self, prompt: str, request: TripRequest) -> Dict[str, Any]:
+        """Execute the planning process step by step"""
+        
+        # The tool calls are driven by the request rather than by the model, so
+        # run them first and ask Gemini for the itinerary in a single round-trip
+        tool_results = await self._execute_tool_calls(request)
+        final_prompt = self._create_final_prompt(prompt, request, tool_results)
         
         final_response = await self._call_gemini(final_prompt)
         
         return {
-            "initial_response": response,
             "tool_results": tool_results,
             "final_itinerary": final_response
         }
 
+    def _create_final_prompt(self, prompt: str, request: TripRequest, tool_results: Dict[str, Any]) -> str:
+        """Combine the planning brief and the pre-fetched tool results into the itinerary prompt"""
+        tool_results_json = orjson.dumps(
+            tool_results, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+        final_prompt = self._create_system_prompt() + "\n\n" + prompt + _FINAL_PROMPT_TEMPLATE.format(
+            tool_results_json=tool_results_json,
+            destination=request.destination,
+            total_days=request.duration_days,
+            budget=_format_inr(request.budget)
+        )
+        return final_prompt
+
     async def _call_gemini(self, prompt: str) -> str:
         """Call Gemini with the given prompt"""
+        key = hashlib.sha256(prompt.encode()).digest()
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            logger.debug("Gemini response cache hit")
+            return cached
+        
+        # Identical prompts already on their way to Gemini share that call's result
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.debug("Joining in-flight Gemini call")
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only the leading request was cancelled, not this one; make the call ourselves
+                if not inflight.cancelled():
+                    raise
+                return await self._invoke_gemini(key, prompt)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.llm.invoke(prompt).content
-            )
-            return response
-        except Exception as e:
-            logger.error(f"Error calling Gemini: {str(e)}")
-            return f"Error: {str(e)}"
+            result = await self._invoke_gemini(key, prompt)
+            future.set_result(result)
+            return result
+        except BaseException:
+            # Errors come back as strings, so this is the leading call being
+            # cancelled; followers see the cancelled future and call Gemini themselves
+            future.cancel()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _invoke_gemini(self, key: bytes, prompt: str) -> str:
+        """Send the prompt to Gemini, retrying transient errors and caching the response"""
+        if not _gemini_breaker.allow():
+            logger.warning("Gemini circuit open, skipping call")
+            return "Error: Gemini is temporarily unavailable"
+        for attempt in range(1, _GEMINI_MAX_ATTEMPTS + 1):
+            try:
+                # ainvoke uses the client's non-blocking transport, so no executor
+                # thread is tied up while waiting on Gemini
+                response = await self.llm.ainvoke(prompt)
+                _gemini_breaker.record_success()
+                self._response_cache[key] = response.content
+                return response.content
+            except _GEMINI_TRANSIENT_ERRORS as e:
+                if attempt == _GEMINI_MAX_ATTEMPTS:
+                    _gemini_breaker.record_failure()
+                    logger.error("Error calling Gemini after %d attempts: %s", attempt, e)
+                    return f"Error: {str(e)}"
+                # Full jitter keeps concurrent sessions from retrying in lockstep
+                delay = random.uniform(0, min(_GEMINI_RETRY_MAX_DELAY, _GEMINI_RETRY_BASE_DELAY * 2 ** attempt))
+                logger.warning("Transient Gemini error (attempt %d), retrying in %.2fs: %s", attempt, delay, e)
+                await asyncio.sleep(delay)
+            except Exception as e:
+                # Still resolves a half-open probe, so the breaker never waits out another timeout
+                _gemini_breaker.record_failure()
+                logger.error(f"Error calling Gemini: {str(e)}")
+                return f"Error: {str(e)}"
+
+    async def _stream_gemini(self, prompt: str) -> AsyncIterator[str]:
+        """Stream Gemini's response chunk by chunk, caching the full text once it completes"""
+        key = hashlib.sha256(prompt.encode()).digest()
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            logger.debug("Gemini response cache hit")
+            yield cached
+            return
+        if not _gemini_breaker.allow():
+            logger.warning("Gemini circuit open, skipping call")
+            yield "Error: Gemini is temporarily unavailable"
+            return
+        chunks = []
+        for attempt in range(1, _GEMINI_MAX_ATTEMPTS + 1):
+            try:
+                async for chunk in self.llm.astream(prompt):
+                    chunks.append(chunk.content)
+                    yield chunk.content
+                break
+            except Exception as e:
+                # Only retry before anything reached the client, or the text would be duplicated
+                if isinstance(e, _GEMINI_TRANSIENT_ERRORS) and not chunks and attempt < _GEMINI_MAX_ATTEMPTS:
+                    delay = random.uniform(0, min(_GEMINI_RETRY_MAX_DELAY, _GEMINI_RETRY_BASE_DELAY * 2 ** attempt))
+                    logger.warning("Transient Gemini stream error (attempt %d), retrying in %.2fs: %s", attempt, delay, e)
+                    await asyncio.sleep(delay)
+                    continue
+                _gemini_breaker.record_failure()
+                logger.error(f"Error streaming from Gemini: {str(e)}")
+                yield f"Error: {str(e)}"
+                return
+        _gemini_breaker.record_success()
+        self._response_cache[key] = "".join(chunks)
 
-    async def _execute_tool_calls(self, response: str, request: TripRequest) -> Dict[str, Any]:
-        """Execute tool calls found in the response"""
+    async def _execute_tool_calls(self, request: TripRequest) -> Dict[str, Any]:
+        """Execute the tool calls needed for the request"""
         tool_results = {}
         
         # Execute each tool with appropriate parameters
         try:
-            print(f"🔧 Executing tool calls for {request.destination}")
-            print(f"🛠️ use_real_api setting: {request.use_real_api}")
+            logger.debug("Executing tool calls for %s", request.destination)
+            logger.debug("use_real_api setting: %s", request.use_real_api)
+            logger.debug("Using source: %s, destination: %s", request.source, request.destination)
             
-            # Flight search
-            flight_tool = self.tools["flight_search"]
-            print(f"🛫 Calling flight search tool...")
-            print(f"🌍 Using source: {request.source}, destination: {request.destination}")
-            flight_result = flight_tool._run(
-                origin=request.source,  # Use the source location from the request
-                destination=request.destination,
-                departure_date=request.start_date or "2025-06-28",
-                passengers=request.travelers,
-                budget_max=request.budget,
-                use_real_api=request.use_real_api
-            )
+            # One start/checkout pair shared by every tool, so repeated trips hit the same cache keys
+            start_date_str, check_out_date_str = _trip_dates(request.start_date, request.duration_days)
+            logger.debug("Calculated dates: %s to %s", start_date_str, check_out_date_str)
             
-            print(f"📊 Flight tool returned: {type(flight_result)}")
-            print(f"🔍 Flight result keys: {list(flight_result.keys()) if isinstance(flight_result, dict) else 'Not a dict'}")
+            # The tools are independent, so await their async entry points side by side
+            tasks = {
+                "flights": self.tools["flight_search"]._arun(
+                    origin=request.source,  # Use the source location from the request
+                    destination=request.destination,
+                    departure_date=start_date_str,
+                    passengers=request.travelers,
+                    budget_max=request.budget,
+                    use_real_api=request.use_real_api
+                ),
+                "hotels": self.tools["hotel_search"]._arun(
+                    location=request.destination,
+                    check_in_date=start_date_str,
+                    check_out_date=check_out_date_str,
+                    guests=request.travelers,
+                    hotel_type=request.accommodation_type,
+                    use_real_api=request.use_real_api
+                ),
+                "attractions": self.tools["attraction_search"]._arun(
+                    location=request.destination,
+                    interests=request.interests
+                ),
+                "restaurants": self.tools["restaurant_search"]._arun(
+                    location=request.destination,
+                    cuisine_type="local"
+                ),
+                "weather": self.tools["weather_info"]._arun(
+                    location=request.destination,
+                    date=start_date_str
+                ),
+            }
+            results = await asyncio.gather(*tasks.values(), return_exceptions=True)
             
-            if isinstance(flight_result, dict):
-                if 'flights' in flight_result and isinstance(flight_result['flights'], dict) and 'options' in flight_result['flights']:
-                    # Already has the correct structure with flights.options
-                    print(f"✈️ Found {len(flight_result['flights']['options'])} structured flights")
-                    tool_results["flights"] = flight_result['flights']
-                    print(f"🎯 Stored flights in tool_results with {len(flight_result['flights']['options'])} options")
-                elif 'flights' in flight_result and isinstance(flight_result['flights'], list):
-                    # Handle case where flights is a direct list of options
-                    print(f"✈️ Found {len(flight_result['flights'])} structured flights")
-                    tool_results["flights"] = {
-                        "formatted": flight_result.get("formatted", ""),
-                        "options": flight_result["flights"],  # This is what frontend expects
-                        "status": "sample_data",
-                        "disclaimer": "Sample flight data for demonstration purposes"
-                    }
-                    print(f"🎯 Stored flights in tool_results with {len(flight_result['flights'])} options")
+            for name, result in zip(tasks, results):
+                if isinstance(result, Exception):
+                    logger.error("Error executing %s tool: %s", name, result)
+                    # Keyed by tool, so one failure doesn't hide another from the same run
+                    tool_results.setdefault("errors", {})[name] = str(result)
+                elif name == "flights":
+                    tool_results["flights"] = self._normalize_flight_result(result)
                 else:
-                    print(f"⚠️ Unexpected flight result structure, trying to adapt")
-                    tool_results["flights"] = {
-                        "formatted": flight_result.get("formatted", ""),
-                        "options": flight_result.get("flights", []),
-                        "status": "adapted_data",
-                        "disclaimer": "Sample flight data (adapted format)"
-                    }
-            else:
-                print(f"❌ Unexpected flight result format: {flight_result}")
-                tool_results["flights"] = {"formatted": str(flight_result), "options": []}
-            
-            # Hotel search
-            hotel_tool = self.tools["hotel_search"]
-            
-            # Calculate proper check-in and check-out dates
-            from datetime import datetime, timedelta, date
-            
-            # Handle the start date properly regardless of type (string or date)
-            if isinstance(request.start_date, date):
-                # It's already a date object
-                start_date = request.start_date
-                start_date_str = start_date.strftime("%Y-%m-%d")
-            elif isinstance(request.start_date, str) and request.start_date:
-                # It's a string, parse it
-                try:
-                    start_date = datetime.strptime(request.start_date, "%Y-%m-%d").date()
-                    start_date_str = request.start_date
-                except:
-                    # Invalid string format, use default
-                    start_date = datetime.now().date()
-                    start_date_str = start_date.strftime("%Y-%m-%d")
-            else:
-                # No start date provided or invalid type, use default
-                start_date = datetime.now().date()
-                start_date_str = start_date.strftime("%Y-%m-%d")
-                
-            # Calculate checkout date
-            try:
-                # Calculate check-out date based on duration
-                end_date = start_date + timedelta(days=request.duration_days)
-                # Format to string
-                check_out_date_str = end_date.strftime("%Y-%m-%d")
-                print(f"✅ Calculated dates: {start_date_str} to {check_out_date_str}")
-            except Exception as e:
-                print(f"⚠️ Error calculating checkout date: {str(e)}")
-                # Fallback to default dates if there's an issue
-                end_date = start_date + timedelta(days=3)
-                check_out_date_str = end_date.strftime("%Y-%m-%d")
-            
-            hotel_result = hotel_tool._run(
-                location=request.destination,
-                check_in_date=start_date_str,
-                check_out_date=check_out_date_str,
-                guests=request.travelers,
-                hotel_type=request.accommodation_type,
-                use_real_api=request.use_real_api
-            )
-            tool_results["hotels"] = hotel_result
-            
-            # Attraction search
-            attraction_tool = self.tools["attraction_search"]
-            attraction_result = attraction_tool._run(
-                location=request.destination,
-                interests=request.interests
-            )
-            tool_results["attractions"] = attraction_result
-            
-            # Restaurant search
-            restaurant_tool = self.tools["restaurant_search"]
-            restaurant_result = restaurant_tool._run(
-                location=request.destination,
-                cuisine_type="local"
-            )
-            tool_results["restaurants"] = restaurant_result
-            
-            # Weather info
-            weather_tool = self.tools["weather_info"]
-            weather_result = weather_tool._run(
-                location=request.destination,
-                date=request.start_date
-            )
-            tool_results["weather"] = weather_result
+                    tool_results[name] = result
             
         except Exception as e:
             logger.error(f"Error executing tools: {str(e)}")
@@ -353,30 +560,55 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
         
         return tool_results
 
+    def _normalize_flight_result(self, flight_result: Any) -> Dict[str, Any]:
+        """Bring the flight tool output into the flights.options shape the frontend expects"""
+        if not isinstance(flight_result, dict):
+            logger.warning("Unexpected flight result format: %s", flight_result)
+            return {"formatted": str(flight_result), "options": []}
+        
+        if 'flights' in flight_result and isinstance(flight_result['flights'], dict) and 'options' in flight_result['flights']:
+            # Already has the correct structure with flights.options
+            logger.debug("Found %d structured flights", len(flight_result['flights']['options']))
+            return flight_result['flights']
+        if 'flights' in flight_result and isinstance(flight_result['flights'], list):
+            # Handle case where flights is a direct list of options
+            logger.debug("Found %d structured flights", len(flight_result['flights']))
+            return {
+                "formatted": flight_result.get("formatted", ""),
+                "options": flight_result["flights"],  # This is what frontend expects
+                "status": "sample_data",
+                "disclaimer": "Sample flight data for demonstration purposes"
+            }
+        logger.warning("Unexpected flight result structure, trying to adapt")
+        return {
+            "formatted": flight_result.get("formatted", ""),
+            "options": flight_result.get("flights", []),
+            "status": "adapted_data",
+            "disclaimer": "Sample flight data (adapted format)"
+        }
+    
     def _structure_itinerary(self, agent_result: Dict[str, Any], request: TripRequest) -> Dict[str, Any]:
         """Structure the agent result into a proper itinerary format"""
         try:
-            print(f"🏗️ Structuring itinerary for {request.destination}")
+            logger.debug("Structuring itinerary for %s", request.destination)
             
             # Extract the final itinerary from agent result
             final_response = agent_result.get("final_itinerary", "")
             tool_results = agent_result.get("tool_results", {})
             
-            print(f"📋 Tool results keys: {list(tool_results.keys())}")
+            logger.debug("Tool results keys: %s", tool_results.keys())
             
             # Get flight data from tool results
             flight_data = tool_results.get("flights", {})
-            print(f"✈️ Flight data type: {type(flight_data)}")
-            print(f"🔍 Flight data keys: {list(flight_data.keys()) if isinstance(flight_data, dict) else 'Not a dict'}")
             
             # Ensure flight data always has the expected structure for the frontend
             if isinstance(flight_data, dict) and "options" in flight_data and isinstance(flight_data["options"], list):
                 # Already in correct format
                 flight_structured = flight_data
-                print(f"✅ Using structured flight data with {len(flight_data['options'])} options")
+                logger.debug("Using structured flight data with %d options", len(flight_data['options']))
             elif isinstance(flight_data, dict) and 'flights' in flight_data:
                 # Legacy format: flight_data.flights is the options array
-                print(f"🔄 Converting flight data from legacy format...")
+                logger.debug("Converting flight data from legacy format")
                 flight_options = flight_data.get("flights", [])
                 if isinstance(flight_options, list):
                     flight_structured = {
@@ -393,49 +625,45 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
                         "status": flight_options.get("status", "sample_data") if isinstance(flight_options, dict) else "sample_data",
                         "disclaimer": flight_options.get("disclaimer", "Sample flight data") if isinstance(flight_options, dict) else "Sample flight data"
                     }
-                print(f"🔧 Converted to {len(flight_structured['options'])} options")
+                logger.debug("Converted to %d options", len(flight_structured['options']))
             elif isinstance(flight_data, list):
                 # Direct array of flight options
-                print(f"🔄 Converting flight data from direct list...")
+                logger.debug("Converting flight data from direct list")
                 flight_structured = {
                     "options": flight_data,
                     "status": "sample_data",
                     "disclaimer": "Sample flight data for demonstration purposes"
                 }
-                print(f"🔧 Converted direct list to {len(flight_structured['options'])} options")
+                logger.debug("Converted direct list to %d options", len(flight_structured['options']))
             else:
                 # Emergency fallback
-                print(f"⚠️ Using empty flight data structure")
+                logger.warning("Using empty flight data structure")
                 flight_structured = {
                     "options": [],
                     "status": "error",
                     "disclaimer": "No flight data available"
                 }
-                print(f"⚠️ No valid flight options found")
+                logger.warning("No valid flight options found")
             
             # Try to parse JSON from the response
             try:
-                # Look for JSON in the response
-                json_match = re.search(r'\{.*\}', final_response, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group()
-                    structured_data = json.loads(json_str)
-                else:
+                structured_data = _parse_itinerary_json(final_response)
+                if structured_data is None:
                     structured_data = self._create_fallback_structure(final_response, request)
             except Exception as e:
                 # If JSON parsing fails, create structure from text
-                print(f"⚠️ Failed to parse JSON from Gemini response: {str(e)}")
+                logger.warning("Failed to parse JSON from Gemini response: %s", e)
                 structured_data = self._create_fallback_structure(final_response, request)
             
             # Extract hotel data if available
             hotel_structured = None
             if "hotels" in tool_results:
-                print(f"🔍 DEBUG hotel_result structure: {list(tool_results['hotels'].keys())}")
+                logger.debug("Hotel result structure: %s", tool_results['hotels'].keys())
                 
                 if isinstance(tool_results["hotels"], dict) and "hotels" in tool_results["hotels"]:
                     # The hotel data is structured correctly with nested "hotels" key
                     hotel_structured = tool_results["hotels"]["hotels"]
-                    print(f"✅ Using structured hotel data with {len(hotel_structured.get('options', []))} options")
+                    logger.debug("Using structured hotel data with %d options", len(hotel_structured.get('options', [])))
                 elif isinstance(tool_results["hotels"], dict):
                     # Direct structure without nested "hotels" key - create proper structure
                     if "options" in tool_results["hotels"]:
@@ -460,25 +688,25 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
                             "disclaimer": tool_results["hotels"].get("disclaimer", "Hotel options for your stay")
                         }
                     
-                    print(f"🔄 Adapted hotel data structure with {len(hotel_structured['options'])} options")
+                    logger.debug("Adapted hotel data structure with %d options", len(hotel_structured['options']))
             
             # Create emergency hotel data if needed as fallback
             if hotel_structured is None or not hotel_structured.get('options') or len(hotel_structured.get('options', [])) == 0:
-                print("⚠️ No valid hotel data found, creating fallback hotel data")
+                logger.warning("No valid hotel data found, creating fallback hotel data")
                 hotel_fallback = self._create_fallback_hotels(request)
                 hotel_structured = {
                     "options": hotel_fallback,
                     "status": "sample_data",
                     "disclaimer": "Sample hotel data (fallback)"
                 }
-                print(f"✅ Created fallback hotel data with {len(hotel_structured['options'])} options")
+                logger.debug("Created fallback hotel data with %d options", len(hotel_structured['options']))
                 
             # Enhance the daily itinerary with more descriptive content
             daily_itinerary = structured_data.get("daily_itinerary", [])
             
             # If we have a valid daily itinerary from Gemini, enhance it with hotel info
             if daily_itinerary and isinstance(daily_itinerary, list):
-                print(f"📆 Found {len(daily_itinerary)} days in Gemini-generated itinerary")
+                logger.debug("Found %d days in Gemini-generated itinerary", len(daily_itinerary))
                 # If we have hotel options, link them to the daily itinerary
                 if hotel_structured and hotel_structured.get('options'):
                     # Use the first hotel option as the selected hotel for the itinerary
@@ -500,9 +728,14 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
                                 }
             else:
                 # If no daily itinerary was generated by Gemini, create a more detailed fallback
-                print("⚠️ No valid daily itinerary found, creating enhanced fallback itinerary")
+                logger.warning("No valid daily itinerary found, creating enhanced fallback itinerary")
                 daily_itinerary = self._create_enhanced_daily_itinerary(request, hotel_structured)
                 
+            # Flights and hotels are surfaced at the top level, so leave them out of tool_results
+            other_tool_results = tool_results.copy()
+            other_tool_results.pop("flights", None)
+            other_tool_results.pop("hotels", None)
+            
             # Ensure required fields are present
             itinerary = {
                 "destination": request.destination,
@@ -515,33 +748,23 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
                 "accommodation_summary": structured_data.get("accommodation_summary", {}),
                 "cost_breakdown": structured_data.get("cost_breakdown", {}),
                 "recommendations": structured_data.get("recommendations", []),
-                "tool_results": {k: v for k, v in tool_results.items() if k not in ["flights", "hotels"]}  # Avoid duplicates
+                "tool_results": other_tool_results
             }
             
-            print(f"🎯 Final itinerary flights: {len(itinerary['flights'].get('options', []))} options")
-            print(f"📤 Sending to frontend - flights type: {type(itinerary['flights'])}")
-            
-            # Log final flight data being sent to frontend
-            if itinerary['flights'].get('options'):
-                for i, flight in enumerate(itinerary['flights']['options'][:3]):
-                    print(f"📤 Frontend Flight {i+1}: {flight.get('airlines', [])} - ₹{flight.get('price_inr', 0):,.0f}")
-                    
-            # Log hotel data
-            if itinerary.get('hotels') and itinerary['hotels'].get('options'):
-                print(f"🏨 Final itinerary hotels: {len(itinerary['hotels'].get('options', []))} options")
-                for i, hotel in enumerate(itinerary['hotels']['options'][:3]):
-                    print(f"🏨 Frontend Hotel {i+1}: {hotel.get('name', '')} - ₹{hotel.get('price_per_night', 0):,.0f}/night")
-            
-            # Add debug info for frontend
-            print("\n🔍 FINAL ITINERARY STRUCTURE:")
-            print(f"- flights: {type(itinerary['flights'])} with {len(itinerary['flights'].get('options', []))} options")
-            print(f"- Has flights.options? {'options' in itinerary['flights']}")
-            print(f"- First flight airline: {itinerary['flights'].get('options', [{}])[0].get('airlines', []) if itinerary['flights'].get('options') else 'N/A'}")
-            print(f"- Daily itinerary days: {len(itinerary['daily_itinerary'])}")
+            # Log the data being sent to the frontend; skipped entirely unless DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Final itinerary flights: %d options", len(itinerary['flights'].get('options', [])))
+                for i, flight in enumerate(itinerary['flights'].get('options', [])[:3]):
+                    logger.debug("Frontend Flight %d: %s - ₹%s", i + 1, flight.get('airlines', []), f"{flight.get('price_inr', 0):,.0f}")
+                if itinerary.get('hotels') and itinerary['hotels'].get('options'):
+                    logger.debug("Final itinerary hotels: %d options", len(itinerary['hotels']['options']))
+                    for i, hotel in enumerate(itinerary['hotels']['options'][:3]):
+                        logger.debug("Frontend Hotel %d: %s - ₹%s/night", i + 1, hotel.get('name', ''), f"{hotel.get('price_per_night', 0):,.0f}")
+                logger.debug("Daily itinerary days: %d", len(itinerary['daily_itinerary']))
             
             # Ensure flights.options always exists
             if 'flights' in itinerary and not itinerary['flights'].get('options'):
-                print("⚠️ Adding empty options array to flights")
+                logger.debug("Adding empty options array to flights")
                 itinerary['flights']['options'] = []
             
             return itinerary
@@ -553,34 +776,11 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
 
     def _get_airport_code(self, location: str) -> str:
         """Convert city name to IATA airport code for fallback scenarios"""
-        # Common airport mappings
-        airport_codes = {
-            # India
-            'delhi': 'DEL', 'new delhi': 'DEL',
-            'mumbai': 'BOM', 'bombay': 'BOM',
-            'bangalore': 'BLR', 'bengaluru': 'BLR',
-            'chennai': 'MAA', 'madras': 'MAA',
-            'hyderabad': 'HYD',
-            'kolkata': 'CCU', 'calcutta': 'CCU',
-            'goa': 'GOI',
-            
-            # International
-            'tokyo': 'NRT', 'japan': 'NRT',
-            'london': 'LHR', 'uk': 'LHR',
-            'paris': 'CDG', 'france': 'CDG',
-            'new york': 'JFK', 'nyc': 'JFK',
-            'dubai': 'DXB', 'uae': 'DXB',
-            'singapore': 'SIN',
-            'bangkok': 'BKK', 'thailand': 'BKK',
-            'sydney': 'SYD', 'australia': 'SYD'
-        }
-        
-        location_lower = location.lower().strip()
-        return airport_codes.get(location_lower, location.upper()[:3])
+        return _AIRPORT_CODES.get(location.lower().strip(), location.upper()[:3])
 
     def _create_fallback_structure(self, output: str, request: TripRequest) -> Dict[str, Any]:
         """Create a basic structure when JSON parsing fails"""
-        print("📄 Creating fallback structure for itinerary using enhanced daily itinerary")
+        logger.debug("Creating fallback structure for itinerary using enhanced daily itinerary")
         
         # Create hotel fallback data for the enhanced daily itinerary
         hotel_fallback = self._create_fallback_hotels(request)
@@ -761,12 +961,13 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
             hotels.append(hotel)
         
         # Sort by a calculated value score (better rating and lower price is better)
+        max_price = max(h["price_per_night"] for h in hotels) or 1.0
         for hotel in hotels:
-            price_factor = 1.0 - (hotel["price_per_night"] / max(h["price_per_night"] for h in hotels))
+            price_factor = 1.0 - (hotel["price_per_night"] / max_price)
             hotel["value_score"] = (hotel["rating"] / 5) * 0.6 + price_factor * 0.4
             
-        hotels.sort(key=lambda x: -x["value_score"])
-        print(f"✅ Created {len(hotels)} fallback hotels (best: {hotels[0]['name']})")
+        hotels.sort(key=itemgetter("value_score"), reverse=True)
+        logger.debug("Created %d fallback hotels (best: %s)", len(hotels), hotels[0]['name'])
         return hotels
 
     def _create_emergency_fallback(self, request: TripRequest) -> Dict[str, Any]:
@@ -806,7 +1007,7 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
                 if isinstance(attraction_result, dict) and "attractions" in attraction_result:
                     attractions = attraction_result["attractions"]
             except Exception as e:
-                print(f"⚠️ Error getting attractions for enhanced itinerary: {str(e)}")
+                logger.warning("Error getting attractions for enhanced itinerary: %s", e)
                 
         # If no attractions, create dummy ones
         if not attractions:
@@ -921,6 +1122,31 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
         # Calculate daily budget (excluding flights)
         daily_budget = (request.budget * 0.6) / request.duration_days  # 60% of budget after flights
         
+        # The hotel is the same every night, so its name and accommodation entry are built once
+        hotel_name = selected_hotel.get('name', 'hotel') if selected_hotel else 'hotel'
+        if selected_hotel:
+            accommodation = {
+                "name": selected_hotel.get("name", "Selected Hotel"),
+                "rating": selected_hotel.get("rating", 4.0),
+                "price_per_night": selected_hotel.get("price_per_night", 0),
+                "total_price": selected_hotel.get("total_price", 0),
+                "address": selected_hotel.get("address", ""),
+                "location": selected_hotel.get("location", ""),
+                "amenities": selected_hotel.get("amenities", []),
+                "hotel_id": selected_hotel.get("id", "hotel_1")
+            }
+        else:
+            accommodation = {
+                "name": f"{request.accommodation_type.capitalize()} in {request.destination}",
+                "rating": 4.0,
+                "price_per_night": daily_budget * 0.4,
+                "total_price": daily_budget * 0.4 * request.duration_days,
+                "address": f"{request.destination} City Center",
+                "location": f"{request.destination} - Central Area",
+                "amenities": ["WiFi", "Air Conditioning", "Breakfast Available"],
+                "hotel_id": "fallback_hotel"
+            }
+        
         for day in range(1, request.duration_days + 1):
             # Create a varied schedule based on day number
             if day == 1:
@@ -935,7 +1161,7 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
                         "type": "transportation"
                     },
                     {
-                        "name": f"Check-in at {selected_hotel.get('name', 'hotel') if selected_hotel else 'hotel'}",
+                        "name": f"Check-in at {hotel_name}",
                         "description": f"Check-in and refresh after your journey.",
                         "time": "14:00",
                         "duration": "1 hour",
@@ -976,7 +1202,7 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
                         "type": "leisure"
                     },
                     {
-                        "name": f"Check-out from {selected_hotel.get('name', 'hotel') if selected_hotel else 'hotel'}",
+                        "name": f"Check-out from {hotel_name}",
                         "description": "Check-out and store luggage if needed.",
                         "time": "11:00",
                         "duration": "1 hour",
@@ -1006,7 +1232,7 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
                         "name": "Breakfast at Hotel",
                         "description": "Final breakfast at your accommodation.",
                         "time": "08:00",
-                        "restaurant": f"{selected_hotel.get('name', 'hotel') if selected_hotel else 'hotel'} Restaurant",
+                        "restaurant": f"{hotel_name} Restaurant",
                         "cuisine": "Breakfast",
                         "cost": 500,
                         "type": "breakfast"
@@ -1066,7 +1292,7 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
                         "name": "Breakfast at Hotel",
                         "description": "Start your day with a nutritious breakfast.",
                         "time": "08:00",
-                        "restaurant": f"{selected_hotel.get('name', 'hotel') if selected_hotel else 'hotel'} Restaurant",
+                        "restaurant": f"{hotel_name} Restaurant",
                         "cuisine": "Breakfast",
                         "cost": 500,
                         "type": "breakfast"
@@ -1118,31 +1344,10 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
                 )
             }
             
-            # Add accommodation details if available
-            if selected_hotel:
-                daily_item["accommodation"] = {
-                    "name": selected_hotel.get("name", "Selected Hotel"),
-                    "rating": selected_hotel.get("rating", 4.0),
-                    "price_per_night": selected_hotel.get("price_per_night", 0),
-                    "total_price": selected_hotel.get("total_price", 0),
-                    "address": selected_hotel.get("address", ""),
-                    "location": selected_hotel.get("location", ""),
-                    "amenities": selected_hotel.get("amenities", []),
-                    "hotel_id": selected_hotel.get("id", "hotel_1")
-                }
-            else:
-                daily_item["accommodation"] = {
-                    "name": f"{request.accommodation_type.capitalize()} in {request.destination}",
-                    "rating": 4.0,
-                    "price_per_night": daily_budget * 0.4,
-                    "total_price": daily_budget * 0.4 * request.duration_days,
-                    "address": f"{request.destination} City Center",
-                    "location": f"{request.destination} - Central Area",
-                    "amenities": ["WiFi", "Air Conditioning", "Breakfast Available"],
-                    "hotel_id": "fallback_hotel"
-                }
-                
+            # Add accommodation details
+            daily_item["accommodation"] = accommodation
+            
             daily_itinerary.append(daily_item)
         
-        print(f"✅ Created enhanced daily itinerary with {len(daily_itinerary)} days")
+        logger.debug("Created enhanced daily itinerary with %d days", len(daily_itinerary))
         return daily_itinerary
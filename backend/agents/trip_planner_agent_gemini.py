@@ -1,6 +1,5 @@
 from langchain_google_genai import ChatGoogleGenerativeAI
 from typing import Dict, Any, List
-import asyncio
 import json
 import os
 import re
@@ -212,12 +211,10 @@ Make sure all costs fit within the budget of ₹{request.budget:,.0f}.
     async def _call_gemini(self, prompt: str) -> str:
         """Call Gemini with the given prompt"""
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.llm.invoke(prompt).content
-            )
-            return response
+            # ainvoke uses the client's non-blocking transport, so no executor
+            # thread is tied up while waiting on Gemini
+            response = await self.llm.ainvoke(prompt)
+            return response.content
         except Exception as e:
             logger.error(f"Error calling Gemini: {str(e)}")
             return f"Error: {str(e)}"
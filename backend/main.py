@@ -2,6 +2,7 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, StreamingResponse
 import asyncio
+import json
 from typing import Dict, Any
 import os
 from dotenv import load_dotenv
@@ -120,6 +121,43 @@ async def plan_trip(request: TripRequest) -> TripResponse:
         logger.error(f"Error planning trip: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Trip planning failed: {str(e)}")
 
+@app.post("/api/plan-trip/stream")
+async def plan_trip_stream(request: TripRequest) -> StreamingResponse:
+    """
+    Streaming variant of /api/plan-trip
+    
+    Sends the itinerary text as server-sent events while Gemini generates it,
+    followed by a final event carrying the structured itinerary
+    """
+    logger.info(f"Received streamed trip planning request: {request.destination}")
+    
+    session_id = await db.create_trip_session(request.model_dump())
+    
+    async def event_stream():
+        started = {"type": "session", "session_id": session_id}
+        yield f"data: {json.dumps(started)}\n\n"
+        try:
+            async for event in trip_agent.plan_trip_stream(session_id=session_id, request=request):
+                if event["type"] == "itinerary":
+                    itinerary = sanitize_for_json(event["itinerary"])
+                    await db.update_trip_session(session_id, {
+                        "itinerary": itinerary,
+                        "status": "completed"
+                    })
+                    event = {
+                        "type": "itinerary",
+                        "session_id": session_id,
+                        "itinerary": itinerary,
+                        "total_cost": itinerary.get("total_cost", 0)
+                    }
+                yield f"data: {json.dumps(event)}\n\n"
+        except Exception as e:
+            logger.error(f"Error planning trip: {str(e)}")
+            error = {"type": "error", "detail": f"Trip planning failed: {str(e)}"}
+            yield f"data: {json.dumps(error)}\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @app.get("/api/trip-status/{session_id}")
 async def get_trip_status(session_id: str):
     """Get the status of a trip planning session"""
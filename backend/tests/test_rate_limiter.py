@@ -0,0 +1,28 @@
+import time
+import unittest
+
+from utils.rate_limiter import TokenBucket
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_fractional_rate_admits_calls(self):
+        bucket = TokenBucket(rate=0.5)
+        self.assertEqual(bucket.capacity, 1.0)
+        start = time.monotonic()
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_fractional_rate_refills(self):
+        bucket = TokenBucket(rate=4.0, capacity=0.5)
+        bucket.acquire()
+        start = time.monotonic()
+        bucket.acquire()
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_non_positive_rate_is_unlimited(self):
+        bucket = TokenBucket(rate=0)
+        self.assertEqual([bucket.acquire() for _ in range(5)], [0.0] * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import threading
+import time
+
+class CircuitBreaker:
+    """
+    Thread-safe consecutive-failure circuit breaker
+
+    Args:
+        fail_max: Consecutive failures that open the circuit
+        reset_timeout: Seconds the circuit stays open before a single trial call is let through
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._half_open = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead; once the timeout has passed only one trial call is admitted"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            # Restarting the clock rejects everyone else while the probe is in flight, and
+            # admits a fresh probe if this one never reports back
+            self._half_open = True
+            self._opened_at = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._half_open = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            # A failed trial call while half-open re-opens the circuit for another timeout
+            if self._half_open or self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+                self._half_open = False
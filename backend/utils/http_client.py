@@ -0,0 +1,14 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+SERPAPI_SEARCH_URL = "https://serpapi.com/search.json"
+
+# Shared across tools so every outbound call reuses pooled keep-alive TLS connections.
+# 429 is left out of the retry list: a re-send would skip the SerpAPI rate limiter
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+))
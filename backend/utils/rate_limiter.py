@@ -0,0 +1,40 @@
+import os
+import threading
+import time
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter
+
+    Args:
+        rate: Tokens added per second; zero or less disables limiting
+        capacity: Maximum burst size (defaults to rate, never below one token)
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        # A burst below one token could never be filled, so fractional rates would block forever
+        self.capacity = max(1.0, capacity or rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a token is available. Returns the time spent waiting in seconds."""
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+# Shared across tools since SerpAPI enforces its limit per API key
+serpapi_limiter = TokenBucket(rate=float(os.getenv("SERPAPI_MAX_QPS", "5")))